@@ -1,6 +1,7 @@
 """Device Pulse Integration."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from functools import partial
 import logging
@@ -9,19 +10,22 @@ from typing import Any
 from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED, ConfigEntryChange
 from homeassistant.components.ping import PingDataICMPLib, PingDataSubProcess, _can_use_icmp_lib_with_privilege
 from homeassistant.components import zeroconf
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Event, HomeAssistant
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import event
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.hass_dict import HassKey
 
 from . import utils
 from . import websocket_api
-from .arping import PingDataARP
+from .activity import DeviceActivityTracker
+from .arping import ArpProber, ArpSweep, PingDataARP, PingDataARPSocket, PingDataARPSweep
+from .catalog import async_get_integration_catalog
 from .const import (
     CONF_DEVICE_SELECTION_MODE,
     CONF_ENTRY_TYPE,
@@ -36,11 +40,33 @@ from .const import (
     CONF_PING_REQUESTS_PER_ATTEMPT,
     CONF_PING_INTERVAL,
     CONF_PING_METHOD,
+    CONF_PROBE_PRIORITY,
+    CONF_SUSPICION_RETRY_INTERVAL,
+    CONF_OFFLINE_BACKOFF_MAX_INTERVAL,
+    CONF_OFFLINE_BACKOFF_FAST_PATH,
+    CONF_PING_ESCALATE_REQUESTS,
+    CONF_SKIP_REACHABLE_NEIGHBORS,
+    CONF_PASSIVE_LIVENESS,
+    CONF_TCP_PORT,
+    CONF_RESTORE_STATE_ON_STARTUP,
+    CONF_MAX_PACKETS_PER_SECOND,
+    CONF_MAX_PROBES_IN_FLIGHT,
     CONF_SELECTED_DEVICES,
     DEFAULT_PING_ATTEMPTS_BEFORE_FAILURE,
     DEFAULT_PING_REQUESTS_PER_ATTEMPT,
     DEFAULT_PING_INTERVAL,
     DEFAULT_PING_METHOD,
+    DEFAULT_PROBE_PRIORITY,
+    DEFAULT_SUSPICION_RETRY_INTERVAL,
+    DEFAULT_OFFLINE_BACKOFF_MAX_INTERVAL,
+    DEFAULT_OFFLINE_BACKOFF_FAST_PATH,
+    DEFAULT_PING_ESCALATE_REQUESTS,
+    DEFAULT_SKIP_REACHABLE_NEIGHBORS,
+    DEFAULT_PASSIVE_LIVENESS,
+    DEFAULT_TCP_PORT,
+    DEFAULT_RESTORE_STATE_ON_STARTUP,
+    DEFAULT_MAX_PACKETS_PER_SECOND,
+    DEFAULT_MAX_PROBES_IN_FLIGHT,
     DEVICE_SELECTION_ALL,
     DEVICE_SELECTION_EXCLUDE,
     DEVICE_SELECTION_INCLUDE,
@@ -54,10 +80,22 @@ from .const import (
     EVENT_DEVICE_CAME_ONLINE,
     NETWORK_SUMMARY_ENTRY_ID,
     PING_METHOD_ARP,
+    PING_METHOD_ARP_SWEEP,
     PING_METHOD_ICMP,
+    PING_METHOD_TCP,
+    PING_METHOD_HTTP,
     PLATFORMS,
+    SETUP_MAX_CONCURRENCY,
+    SETUP_RAMP_UP_DELAY,
+    SIGNAL_MONITOR_ADDED,
 )
-from .coordinator import DevicePingCoordinator
+from .coordinator import CoordinatorState, DevicePingCoordinator
+from .httping import PingDataHTTP, async_get_device_probe_url
+from .icmp import IcmpEngine, PingDataEscalating, PingDataICMPEngine, is_in_ping_group_range
+from .neighbors import NeighborMonitor
+from .restore import CoordinatorStateHandoff, CoordinatorStateStore, async_get_restored_state
+from .scheduler import ProbeScheduler
+from .tcping import PingDataTCP, TcpProber
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +103,9 @@ DATA_CONFIG_KEY: HassKey["ConfigData"] = HassKey(DOMAIN)
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
+# Options applied to the running monitors, any other option change reloads the entry
+LIVE_OPTIONS = {CONF_PING_ATTEMPTS_BEFORE_FAILURE, CONF_PING_REQUESTS_PER_ATTEMPT, CONF_PING_INTERVAL}
+
 @dataclass
 class ConfigMonitoredIntegrationData:
     """Holds configuration data for a monitored config entry."""
@@ -79,8 +120,17 @@ class ConfigData:
 
     ping_icmp_privileged: bool | None # Flag to true if privileged ICMP ping is available
     ping_arp_available: bool | None # Flag to true if ARP ping is available
-    integrations: dict[str, utils.IntegrationData]
+    ping_arp_socket_available: bool | None # Flag to true if native ARP sockets are available
+    integrations: dict[str, utils.IntegrationData] # Integrations valid for monitoring, maintained by the catalog
     monitored: dict[str, ConfigMonitoredIntegrationData] = field(default_factory=dict)
+    icmp_engine: IcmpEngine | None = None # Shared ICMP engine, available with raw or datagram ICMP sockets
+    arp_prober: ArpProber | None = None # Native ARP prober, available with AF_PACKET sockets
+    scheduler: ProbeScheduler | None = None # Central scheduler dispatching all the probes
+    activity: DeviceActivityTracker | None = None # Passive activity of the monitored devices
+    neighbors: NeighborMonitor | None = None # Kernel neighbor table, available with netlink sockets
+    tcp_prober: TcpProber | None = None # Shared TCP connect prober
+    state_store: CoordinatorStateStore | None = None # Saved state of the device monitors
+    state_handoff: CoordinatorStateHandoff = field(default_factory=CoordinatorStateHandoff) # Live state carried across reloads
 
 
 @dataclass
@@ -89,6 +139,7 @@ class ConfigMonitoredDeviceData:
 
     device: dr.DeviceEntry
     coordinator: DevicePingCoordinator
+    unsubs: list[CALLBACK_TYPE] = field(default_factory=list) # Stop the probes of the monitor
 
 
 @dataclass
@@ -97,29 +148,22 @@ class ConfigEntryRuntimeData:
 
     integration: utils.IntegrationData
     monitored: dict[str, ConfigMonitoredDeviceData] = field(default_factory=dict)
-    reload_task: asyncio.Task[Any] | None = None
-
-
-async def _async_get_or_create_integration(
-    hass: HomeAssistant, domain: str, zc: zeroconf.models.HaZeroconf | None = None
-) -> utils.IntegrationData:
-    """Return integration data, refreshing the cache or creating a fallback."""
-    integrations = hass.data[DATA_CONFIG_KEY].integrations
-    if integration := integrations.get(domain):
-        return integration
-
-    if zc is None:
-        zc = await zeroconf.async_get_instance(hass)
+    add_device: Callable[[dr.DeviceEntry], Awaitable[None]] | None = None # Add the monitor of a new device
+    add_tasks: dict[str, asyncio.Task[Any]] = field(default_factory=dict) # Pending monitors of new devices
+    setup_pending: set[str] = field(default_factory=set) # New devices created while the entry is setting up
+    arp_sweeps: dict[str, ArpSweep] = field(default_factory=dict) # ARP sweeps by network interface
+    options: dict[str, Any] = field(default_factory=dict) # Options the monitors are running with
 
-    integrations = await utils.get_valid_integrations_for_monitoring(hass, zc)
-    hass.data[DATA_CONFIG_KEY].integrations = integrations
 
-    if integration := integrations.get(domain):
+async def _async_get_or_create_integration(hass: HomeAssistant, domain: str) -> utils.IntegrationData:
+    """Return integration data from the catalog, or a fallback without devices."""
+    catalog = async_get_integration_catalog(hass)
+    if integration := await catalog.async_get_integration(domain):
         return integration
 
     friendly_name = await utils.async_get_integration_name(hass, domain)
     integration = utils.IntegrationData(domain, friendly_name, 0, False)
-    integrations[domain] = integration
+    catalog.async_add_fallback(integration)
     return integration
 
 
@@ -129,8 +173,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     ping_icmp_privileged = await _can_use_icmp_lib_with_privilege()
     _LOGGER.info("Privileged ICMP ping available: %s", ping_icmp_privileged)
 
-    # Check if arping is available for ARP ping support
-    if ping_arp_available := await utils.is_arping_available(hass):
+    # Check if native ARP sockets or arping are available for ARP ping support
+    ping_arp_socket_available = await utils.is_arp_socket_available(hass)
+    ping_arp_available = await utils.is_arping_available(hass)
+    if ping_arp_socket_available:
+        _LOGGER.info("ARP ping support available (native ARP sockets)")
+    elif ping_arp_available:
         _LOGGER.info("ARP ping support available (arping command found)")
     else:
         _LOGGER.warning(
@@ -138,18 +186,73 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             "Install iputils-arping package to enable ARP ping functionality"
         )
 
-    zc = await zeroconf.async_get_instance(hass)
-    # Build initial list of integrations valid for monitoring
-    integrations = await utils.get_valid_integrations_for_monitoring(hass, zc)
-    _LOGGER.info("Found %d valid integrations for monitoring: %s",
-        len(integrations),
-        [integration.friendly_name for integration in integrations.values()]
-    )
+    # Start the shared ICMP engine used by all ICMP monitors, on a raw socket when
+    # privileged, otherwise on an unprivileged datagram socket when allowed
+    icmp_engine: IcmpEngine | None = IcmpEngine(hass, privileged=bool(ping_icmp_privileged))
+    try:
+        icmp_engine.start()
+    except OSError as err:
+        if ping_icmp_privileged:
+            _LOGGER.warning("Unable to start shared ICMP engine, using per-device ping: %s", err)
+        else:
+            in_range = await hass.async_add_executor_job(is_in_ping_group_range)
+            _LOGGER.info(
+                "Unprivileged ICMP sockets not available (groups in net.ipv4.ping_group_range: %s), "
+                "using per-device ping: %s",
+                in_range,
+                err,
+            )
+        icmp_engine = None
+
+    # Native ARP prober, interface sockets are opened on first use
+    arp_prober = ArpProber(hass) if ping_arp_socket_available else None
+    # Central scheduler, one timer per ping interval class
+    scheduler = ProbeScheduler(hass)
+    # Saved state of the device monitors, restored on setup
+    state_store = CoordinatorStateStore(hass)
+    await state_store.async_load()
+    # Shared TCP connect prober, capping the connects in flight
+    tcp_prober = TcpProber(hass)
+    # Passive activity tracker of the monitored devices entities
+    activity = DeviceActivityTracker(hass)
+
+    # Kernel neighbor table monitor, skipping probes of recently confirmed neighbors
+    neighbors: NeighborMonitor | None = NeighborMonitor(hass)
+    try:
+        neighbors.start()
+    except OSError as err:
+        _LOGGER.info("Kernel neighbor table not available, neighbors are always probed: %s", err)
+        neighbors = None
+
+    @callback
+    def _stop_probes(_: Event) -> None:
+        scheduler.async_stop()
+        activity.async_stop()
+        if neighbors:
+            neighbors.stop()
+        state_store.async_save_on_final_write()
+        if icmp_engine:
+            icmp_engine.stop()
+        if arp_prober:
+            arp_prober.stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _stop_probes)
+
+    # Integrations are scanned on demand: the monitored ones on setup, all of them by the config flows
+    catalog = async_get_integration_catalog(hass)
     # Store in hass data
     hass.data[DATA_CONFIG_KEY] = ConfigData(
         ping_icmp_privileged,
         ping_arp_available,
-        integrations
+        ping_arp_socket_available,
+        catalog.integrations,
+        icmp_engine=icmp_engine,
+        arp_prober=arp_prober,
+        scheduler=scheduler,
+        activity=activity,
+        neighbors=neighbors,
+        tcp_prober=tcp_prober,
+        state_store=state_store,
     )
 
     # Register listener for config entry updates
@@ -176,6 +279,13 @@ async def async_setup_entry(
 ) -> bool:
     """Set up Device Pulse from a config entry."""
     entry_type = config_entry.data.get(CONF_ENTRY_TYPE)
+    config_entry.async_on_unload(config_entry.add_update_listener(_async_update_listener))
+    # Apply the global probe budget configured on the network summary entry
+    if entry_type == ENTRY_TYPE_NETWORK_SUMMARY:
+        hass.data[DATA_CONFIG_KEY].scheduler.budget.configure(
+            int(config_entry.options.get(CONF_MAX_PROBES_IN_FLIGHT, DEFAULT_MAX_PROBES_IN_FLIGHT)),
+            int(config_entry.options.get(CONF_MAX_PACKETS_PER_SECOND, DEFAULT_MAX_PACKETS_PER_SECOND)),
+        )
     # Create network summary entry if not already exists
     # Setup device ping coordinators used by all platforms
     if entry_type in [ENTRY_TYPE_INTEGRATION, ENTRY_TYPE_CUSTOM_GROUP]:
@@ -187,17 +297,12 @@ async def async_setup_entry(
         if entry_type == ENTRY_TYPE_INTEGRATION:
             # Get integration domain to monitor
             domain = config_entry.data.get(CONF_INTEGRATION)
+            # Get integration data, scanning only the devices of this integration (fallback if missing)
+            integration = await _async_get_or_create_integration(hass, domain)
+            # Create runtime data before pushing the monitored domain, its device events need it
+            config_entry.runtime_data = ConfigEntryRuntimeData(integration, options=dict(config_entry.options))
             # Push monitored domain to hass data
             hass.data[DATA_CONFIG_KEY].monitored.update({domain: ConfigMonitoredIntegrationData(domain, config_entry.entry_id)})
-            # If domain is not into cached integrations list, update it
-            if domain not in hass.data[DATA_CONFIG_KEY].integrations:
-                hass.data[DATA_CONFIG_KEY].integrations = await utils.get_valid_integrations_for_monitoring(hass, zc)
-                _LOGGER.info("Update cache: found %d valid integrations for monitoring: %s",
-                    len(hass.data[DATA_CONFIG_KEY].integrations),
-                    [integration.friendly_name for integration in hass.data[DATA_CONFIG_KEY].integrations.values()]
-                )
-            # Get integration data (fallback if still missing)
-            integration = await _async_get_or_create_integration(hass, domain, zc)
 
             device_mode = config_entry.options.get(CONF_DEVICE_SELECTION_MODE, DEVICE_SELECTION_ALL)
             selected_devices = config_entry.options.get(CONF_SELECTED_DEVICES, [])
@@ -230,40 +335,91 @@ async def async_setup_entry(
 
             _LOGGER.info("[%s] Setting-Up Monitors:", group_name)
 
-        # Create runtime data for the config entry
-        config_entry.runtime_data = ConfigEntryRuntimeData(integration)
+            # Create runtime data for the config entry
+            config_entry.runtime_data = ConfigEntryRuntimeData(integration, options=dict(config_entry.options))
+
+        config_entry.async_on_unload(partial(_async_stop_monitors, config_entry))
 
-        ping_attempts_before_failure: int = int(config_entry.options.get(CONF_PING_ATTEMPTS_BEFORE_FAILURE, DEFAULT_PING_ATTEMPTS_BEFORE_FAILURE))
-        ping_requests_per_attempt: int = int(config_entry.options.get(CONF_PING_REQUESTS_PER_ATTEMPT, DEFAULT_PING_REQUESTS_PER_ATTEMPT))
-        ping_interval: int = int(config_entry.options.get(CONF_PING_INTERVAL, DEFAULT_PING_INTERVAL))
+        ping_attempts_before_failure, ping_requests_per_attempt, ping_interval = _get_live_options(config_entry)
         ping_method: str = config_entry.options.get(CONF_PING_METHOD, DEFAULT_PING_METHOD)
+        probe_priority: str = config_entry.options.get(CONF_PROBE_PRIORITY, DEFAULT_PROBE_PRIORITY)
+        suspicion_retry_interval: int = int(config_entry.options.get(CONF_SUSPICION_RETRY_INTERVAL, DEFAULT_SUSPICION_RETRY_INTERVAL))
+        offline_backoff_max_interval: int = int(config_entry.options.get(CONF_OFFLINE_BACKOFF_MAX_INTERVAL, DEFAULT_OFFLINE_BACKOFF_MAX_INTERVAL))
+        offline_backoff_fast_path: bool = config_entry.options.get(CONF_OFFLINE_BACKOFF_FAST_PATH, DEFAULT_OFFLINE_BACKOFF_FAST_PATH)
+        ping_escalate_requests: bool = config_entry.options.get(CONF_PING_ESCALATE_REQUESTS, DEFAULT_PING_ESCALATE_REQUESTS)
+        skip_reachable_neighbors: bool = config_entry.options.get(CONF_SKIP_REACHABLE_NEIGHBORS, DEFAULT_SKIP_REACHABLE_NEIGHBORS)
+        passive_liveness: bool = config_entry.options.get(CONF_PASSIVE_LIVENESS, DEFAULT_PASSIVE_LIVENESS)
+        tcp_port: int = int(config_entry.options.get(CONF_TCP_PORT, DEFAULT_TCP_PORT))
+        restore_state_on_startup: bool = config_entry.options.get(CONF_RESTORE_STATE_ON_STARTUP, DEFAULT_RESTORE_STATE_ON_STARTUP)
 
         _LOGGER.info("[%s]   Attempts Before Failure: %d", integration.friendly_name, ping_attempts_before_failure)
         _LOGGER.info("[%s]   Requests per Attempt: %d", integration.friendly_name, ping_requests_per_attempt)
         _LOGGER.info("[%s]   Interval: %ds", integration.friendly_name, ping_interval)
         _LOGGER.info("[%s]   Ping Method: %s", integration.friendly_name, ping_method)
+        _LOGGER.info("[%s]   Probe Priority: %s", integration.friendly_name, probe_priority)
+        _LOGGER.info("[%s]   Suspicion Retry Interval: %ds", integration.friendly_name, suspicion_retry_interval)
+        _LOGGER.info("[%s]   Offline Backoff Max Interval: %ds", integration.friendly_name, offline_backoff_max_interval)
+        _LOGGER.info("[%s]   Offline Backoff Fast Path: %s", integration.friendly_name, offline_backoff_fast_path)
+        _LOGGER.info("[%s]   Escalate Requests on Timeout: %s", integration.friendly_name, ping_escalate_requests)
+        _LOGGER.info("[%s]   Skip Reachable Neighbors: %s", integration.friendly_name, skip_reachable_neighbors)
+        _LOGGER.info("[%s]   Passive Liveness: %s", integration.friendly_name, passive_liveness)
+        _LOGGER.info("[%s]   Restore State on Startup: %s", integration.friendly_name, restore_state_on_startup)
+        if ping_method == PING_METHOD_TCP:
+            _LOGGER.info("[%s]   TCP Port: %s", integration.friendly_name, tcp_port or "auto")
         _LOGGER.info("[%s] Found [%d] valid devices", integration.friendly_name, len(devices))
 
         # Determine the ICMP ping client based on method and privileges
         ping_icmp: type[PingDataICMPLib | PingDataSubProcess]
         ping_icmp_privileged = hass.data[DATA_CONFIG_KEY].ping_icmp_privileged
         ping_icmp = PingDataSubProcess if ping_icmp_privileged is None else PingDataICMPLib
-
-        ping_arp: type[PingDataARP] | None = None
-        if ping_method == PING_METHOD_ARP:
+        icmp_engine = hass.data[DATA_CONFIG_KEY].icmp_engine
+        scheduler = hass.data[DATA_CONFIG_KEY].scheduler
+        activity = hass.data[DATA_CONFIG_KEY].activity
+        neighbors = hass.data[DATA_CONFIG_KEY].neighbors if skip_reachable_neighbors else None
+        tcp_prober = hass.data[DATA_CONFIG_KEY].tcp_prober
+        state_store = hass.data[DATA_CONFIG_KEY].state_store
+        state_handoff = hass.data[DATA_CONFIG_KEY].state_handoff
+
+        ping_arp: partial[PingDataARP] | None = None
+        arp_sweeps = config_entry.runtime_data.arp_sweeps
+        if ping_method in (PING_METHOD_ARP, PING_METHOD_ARP_SWEEP):
+            ping_arp_available = hass.data[DATA_CONFIG_KEY].ping_arp_available
+            # Prefer native ARP sockets, falling back to arping when not available
+            if arp_prober := hass.data[DATA_CONFIG_KEY].arp_prober:
+                ping_arp = partial(
+                    PingDataARPSweep if ping_method == PING_METHOD_ARP_SWEEP else PingDataARPSocket,
+                    prober=arp_prober,
+                    fallback=bool(ping_arp_available),
+                )
             # Verify arping is available when the ARP method is selected
-            if not hass.data[DATA_CONFIG_KEY].ping_arp_available:
+            elif not ping_arp_available:
                 _LOGGER.error(
                     "[%s] ARP ping method selected but arping command not found. "
                     "Please install iputils-arping package. Falling back to ICMP ping",
                     integration.friendly_name,
                 )
             else:
-                ping_arp = PingDataARP
+                if ping_method == PING_METHOD_ARP_SWEEP:
+                    _LOGGER.warning(
+                        "[%s] ARP sweep requires native ARP sockets. Falling back to ARP ping for each device",
+                        integration.friendly_name,
+                    )
+                ping_arp = partial(PingDataARP)
 
         disabled_devices = []
 
-        for device in devices:
+        @callback
+        def _async_keep_devices_disabled() -> None:
+            for disabled_device in disabled_devices:
+                _LOGGER.warning("[%s] Keep device [%s] disabled", integration.friendly_name, disabled_device.name)
+                device_registry.async_update_device(disabled_device.id, disabled_by=disabled_device.disabled_by)
+            disabled_devices.clear()
+
+        async def _async_setup_device(device: dr.DeviceEntry) -> None:
+            """Create and start the monitor of a device."""
+            # Options applied live may have changed since the entry was set up
+            ping_attempts_before_failure, ping_requests_per_attempt, ping_interval = _get_live_options(config_entry)
+
             # Extract host for the device
             host, host_source = await utils.extract_device_host(hass, device, zc)
 
@@ -274,18 +430,57 @@ async def async_setup_entry(
                 # Based on device mode we have to check if device must be monitored
                 if device_mode == DEVICE_SELECTION_EXCLUDE and device.id in selected_devices:
                     _LOGGER.warning("[%s]   Device excluded [%s]", device.name, integration.friendly_name)
-                    continue
+                    return
                 if device_mode == DEVICE_SELECTION_INCLUDE and device.id not in selected_devices:
                     _LOGGER.warning("[%s]   Device not included [%s]", device.name, integration.friendly_name)
-                    continue
+                    return
 
                 # For ARP ping, check if device ip address is in local subnet,
                 # otherwise fallback to ICMP ping
-                if ping_arp and (resolved_ip := await utils.is_host_in_local_subnet(hass, host)):
-                    ping_instance = PingDataARP(hass, resolved_ip, ping_requests_per_attempt)
+                if ping_method == PING_METHOD_HTTP:
+                    ping_instance = PingDataHTTP(
+                        hass, host, ping_requests_per_attempt, await async_get_device_probe_url(hass, device, host)
+                    )
+                elif ping_method == PING_METHOD_TCP:
+                    ping_instance = PingDataTCP(hass, host, ping_requests_per_attempt, tcp_prober, tcp_port)
+                elif ping_arp and (resolved_ip := await utils.is_host_in_local_subnet(hass, host)):
+                    ping_instance = ping_arp(hass, resolved_ip, ping_requests_per_attempt)
+                elif icmp_engine:
+                    ping_instance = PingDataICMPEngine(
+                        hass, host, ping_requests_per_attempt, icmp_engine, ping_escalate_requests
+                    )
+                elif ping_escalate_requests and ping_requests_per_attempt > 1:
+                    ping_instance = PingDataEscalating(
+                        ping_icmp(hass, host, 1, ping_icmp_privileged),
+                        ping_icmp(hass, host, ping_requests_per_attempt - 1, ping_icmp_privileged),
+                    )
                 else:
                     ping_instance = ping_icmp(hass, host, ping_requests_per_attempt, ping_icmp_privileged)
 
+                # ARP sweeps are grouped by network interface, probe the device alone when none reaches it
+                sweep_adapter = sweep_source_ip = None
+                if isinstance(ping_instance, PingDataARPSweep):
+                    sweep_adapter, sweep_source_ip, _ = await utils.get_network_adapter_for_ip(
+                        hass, ping_instance.ip_address
+                    )
+                    if sweep_adapter is None:
+                        _LOGGER.warning(
+                            "[%s] No network interface found for device [%s] at [%s], probing it without ARP sweep",
+                            integration.friendly_name,
+                            device.name,
+                            ping_instance.ip_address,
+                        )
+                        ping_instance = PingDataARPSocket(
+                            hass,
+                            ping_instance.ip_address,
+                            ping_requests_per_attempt,
+                            prober=arp_prober,
+                            fallback=bool(hass.data[DATA_CONFIG_KEY].ping_arp_available),
+                        )
+
+                # A reachable neighbor only proves the host is up, not that its TCP or HTTP service is
+                device_neighbors = None if isinstance(ping_instance, (PingDataHTTP, PingDataTCP)) else neighbors
+
                 coordinator = DevicePingCoordinator(
                     hass,
                     config_entry,
@@ -295,11 +490,82 @@ async def async_setup_entry(
                     ping_instance,
                     ping_attempts_before_failure,
                     ping_requests_per_attempt,
-                    ping_interval
+                    ping_interval,
+                    scheduler,
+                    probe_priority,
+                    suspicion_retry_interval,
+                    offline_backoff_max_interval,
+                    device_neighbors,
+                    activity if passive_liveness else None,
+                    host,
                 )
-                await coordinator.async_config_entry_first_refresh()
+                # Start from the live state of the previous monitor when reloading,
+                # or from the last known state, the first probe runs on the central schedule
+                if handed_off := state_handoff.async_take(device.id, coordinator.ping_method):
+                    coordinator.restore_state(handed_off)
+                elif restore_state_on_startup and (
+                    restored := state_store.get_state(device.id)
+                    or async_get_restored_state(hass, device, ping_attempts_before_failure)
+                ):
+                    coordinator.restore_state(restored)
+                elif config_entry.state is ConfigEntryState.SETUP_IN_PROGRESS:
+                    await coordinator.async_config_entry_first_refresh()
+                else:
+                    # Device added to a loaded entry, the first refresh can't retry the entry setup
+                    await coordinator.async_refresh()
+                    if not coordinator.last_update_success:
+                        _LOGGER.warning(
+                            "[%s] First ping of device [%s] failed, starting it offline",
+                            integration.friendly_name,
+                            device.name,
+                        )
+                        coordinator.restore_state(CoordinatorState(False, ping_attempts_before_failure))
+
+                unsubs = [state_store.async_register(coordinator)]
+
+                # Group ARP sweep monitors by network interface
+                if sweep_adapter is not None:
+                    interface_name = sweep_adapter.get("name")
+                    arp_sweep_key = _get_arp_sweep_key(config_entry, interface_name)
+                    if not (arp_sweep := arp_sweeps.get(interface_name)):
+                        _LOGGER.info("[%s] Starting ARP sweep on interface [%s]", integration.friendly_name, interface_name)
+                        arp_sweep = arp_sweeps[interface_name] = ArpSweep(
+                            hass, arp_prober, interface_name, sweep_source_ip, ping_requests_per_attempt
+                        )
+                        config_entry.async_on_unload(partial(scheduler.async_remove, arp_sweep_key))
+                    arp_sweep.add(coordinator)
+                    unsubs.append(partial(arp_sweep.remove, coordinator))
+                    # Schedule the sweep again, so its packets account for the new device
+                    scheduler.async_add(
+                        arp_sweep_key,
+                        ping_interval,
+                        arp_sweep.async_run,
+                        probe_priority,
+                        arp_sweep.packets,
+                    )
+                else:
+                    unsubs.append(
+                        scheduler.async_add(
+                            device.id,
+                            ping_interval,
+                            coordinator.async_refresh,
+                            probe_priority,
+                            coordinator.probe_packets,
+                            coordinator.is_probe_due,
+                        )
+                    )
+
+                # Updates pushed by the entities of the device prove it is alive
+                if passive_liveness:
+                    unsubs.append(activity.async_track(device.id))
 
-                config_entry.runtime_data.monitored.update({device.id: ConfigMonitoredDeviceData(device, coordinator)})
+                # Passive signals bring offline devices in backoff back to the normal cadence
+                if offline_backoff_max_interval and offline_backoff_fast_path:
+                    unsubs.append(activity.async_watch(device.id, coordinator.async_wake))
+
+                config_entry.runtime_data.monitored.update(
+                    {device.id: ConfigMonitoredDeviceData(device, coordinator, unsubs)}
+                )
 
                 _LOGGER.info(
                     "[%s] Created monitor for [%s] at [%s] - Initial state: {%s}",
@@ -311,15 +577,99 @@ async def async_setup_entry(
             else:
                 _LOGGER.warning("[%s] Could not extract Host for device [%s]",integration.friendly_name, device.name)
 
-        for disabled_device in disabled_devices:
-            _LOGGER.warning("[%s] Keep device [%s] disabled", integration.friendly_name, disabled_device.name)
-            device_registry.async_update_device(disabled_device.id, disabled_by=disabled_device.disabled_by)
+        # Devices are set up concurrently, so offline devices don't delay the whole entry
+        await utils.async_run_bounded(_async_setup_device, devices, SETUP_MAX_CONCURRENCY, SETUP_RAMP_UP_DELAY)
+        # Keep the monitors, and so the entities, in the order of the devices
+        monitored = config_entry.runtime_data.monitored
+        config_entry.runtime_data.monitored = {device.id: monitored[device.id] for device in devices if device.id in monitored}
+
+        _async_keep_devices_disabled()
+
+        async def _async_add_device(device: dr.DeviceEntry) -> None:
+            """Add the monitor of a device created after the setup, with its entities."""
+            await _async_setup_device(device)
+            _async_keep_devices_disabled()
+
+            if monitored_device := config_entry.runtime_data.monitored.get(device.id):
+                async_dispatcher_send(hass, SIGNAL_MONITOR_ADDED.format(config_entry.entry_id), monitored_device)
+
+        config_entry.runtime_data.add_device = _async_add_device
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
+    # Add the monitors of the devices created while the entry was setting up, now the platforms listen
+    if entry_type in [ENTRY_TYPE_INTEGRATION, ENTRY_TYPE_CUSTOM_GROUP]:
+        for device_id in config_entry.runtime_data.setup_pending:
+            _async_schedule_add_monitor(hass, config_entry, device_id)
+        config_entry.runtime_data.setup_pending.clear()
+
     return True
 
 
+def _get_live_options(config_entry: ConfigEntry) -> tuple[int, int, int]:
+    """Return the attempts before failure, requests per attempt and interval options."""
+    return (
+        int(config_entry.options.get(CONF_PING_ATTEMPTS_BEFORE_FAILURE, DEFAULT_PING_ATTEMPTS_BEFORE_FAILURE)),
+        int(config_entry.options.get(CONF_PING_REQUESTS_PER_ATTEMPT, DEFAULT_PING_REQUESTS_PER_ATTEMPT)),
+        int(config_entry.options.get(CONF_PING_INTERVAL, DEFAULT_PING_INTERVAL)),
+    )
+
+
+def _get_arp_sweep_key(config_entry: ConfigEntry, interface_name: str) -> str:
+    """Return the scheduler key of the ARP sweep of an interface."""
+    return f"{config_entry.entry_id}_arp_sweep_{interface_name}"
+
+
+async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Handle options updates.
+
+    Interval, attempts before failure and requests per attempt are applied
+    to the running monitors, keeping their state. Any other change, like the
+    ping method or the enabled sensors, reloads the entry.
+    """
+    if config_entry.data.get(CONF_ENTRY_TYPE) not in [ENTRY_TYPE_INTEGRATION, ENTRY_TYPE_CUSTOM_GROUP]:
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+
+    runtime_data: ConfigEntryRuntimeData = config_entry.runtime_data
+    integration = runtime_data.integration
+    changed = {
+        key
+        for key in runtime_data.options.keys() | config_entry.options.keys()
+        if runtime_data.options.get(key) != config_entry.options.get(key)
+    }
+
+    if not changed:
+        return
+
+    # Handlers from the ping integration can't change their requests count while running
+    if not changed <= LIVE_OPTIONS or (
+        CONF_PING_REQUESTS_PER_ATTEMPT in changed
+        and not all(monitored.coordinator.can_update_requests_per_attempt for monitored in runtime_data.monitored.values())
+    ):
+        _LOGGER.info("[%s] Options %s changed, reloading config entry", integration.friendly_name, sorted(changed))
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+
+    runtime_data.options = dict(config_entry.options)
+    ping_attempts_before_failure, ping_requests_per_attempt, ping_interval = _get_live_options(config_entry)
+    scheduler = hass.data[DATA_CONFIG_KEY].scheduler
+
+    _LOGGER.info("[%s] Applying options to the running monitors:", integration.friendly_name)
+    _LOGGER.info("[%s]   Attempts Before Failure: %d", integration.friendly_name, ping_attempts_before_failure)
+    _LOGGER.info("[%s]   Requests per Attempt: %d", integration.friendly_name, ping_requests_per_attempt)
+    _LOGGER.info("[%s]   Interval: %ds", integration.friendly_name, ping_interval)
+
+    for device_id, monitored_device in runtime_data.monitored.items():
+        monitored_device.coordinator.update_options(ping_attempts_before_failure, ping_requests_per_attempt, ping_interval)
+        # Monitors of ARP sweeps are not scheduled on their own, nothing is done for them
+        scheduler.async_update(device_id, ping_interval, monitored_device.coordinator.probe_packets)
+
+    for interface_name, arp_sweep in runtime_data.arp_sweeps.items():
+        arp_sweep.count = ping_requests_per_attempt
+        scheduler.async_update(_get_arp_sweep_key(config_entry, interface_name), ping_interval, arp_sweep.packets)
+
+
 async def _config_entry_updated(
     change: ConfigEntryChange, updated_config_entry: ConfigEntry, hass: HomeAssistant
 ) -> None:
@@ -366,8 +716,7 @@ async def _config_entry_updated(
                 and not other_config_entry.disabled_by
                 for entry_id in device_entry.config_entries
             ):
-                integrations = hass.data[DATA_CONFIG_KEY].integrations
-                integration = integrations.get(updated_config_entry.domain)
+                integration = await _async_get_or_create_integration(hass, updated_config_entry.domain)
                 _LOGGER.info(
                     "[%s] Disabling device [%s] as no other config entries are enabled",
                     integration.friendly_name,
@@ -387,12 +736,11 @@ async def _device_registry_updated(
     We have 2 type of events:
     - create: in this case we have to check if any config entries of the
       device belongs to the monitored integration.
-      If true, we have to reload to add the related sensors
+      If true, we have to add the monitor and the related sensors
     - update: the event occurs in case of any change (e.g.: disabled by someone) or
       if the original config entry has been deleted. The device is not delete
       because we have attached our sensors and no "remove" event occurs
     """
-    integrations = hass.data[DATA_CONFIG_KEY].integrations
     monitored = hass.data[DATA_CONFIG_KEY].monitored
     action = device_event.data["action"]
 
@@ -409,8 +757,6 @@ async def _device_registry_updated(
     if not device_entry:
         return
 
-    reload = False
-
     # Get the primary config entry for the device
     primary_config_entry = hass.config_entries.async_get_entry(device_entry.primary_config_entry)
     # Check if the device belongs to a monitored integration
@@ -422,13 +768,14 @@ async def _device_registry_updated(
     )
 
     if action == "create" and belongs_to_integration:
-        # New device for monitored integration, reload configuration
+        # New device for monitored integration, add its monitor
         _LOGGER.info(
             "[%s] Created Device [%s]",
             integration.friendly_name,
             device_entry.name,
         )
-        reload = True
+        config_entry = hass.config_entries.async_get_entry(monitored[integration.domain].config_entry_id)
+        _async_schedule_add_monitor(hass, config_entry, device_id)
 
     elif action == "update":
         if not belongs_to_integration:
@@ -490,7 +837,8 @@ async def _device_registry_updated(
                         device_entry.name,
                     )
 
-                reload = True
+                config_entry = hass.config_entries.async_get_entry(monitored[integration.domain].config_entry_id)
+                await _async_remove_monitor(config_entry, device_id)
 
         elif event_changes_has_key(device_event, "disabled_by"):
             # Device belongs to monitored integration and was enabled,
@@ -530,21 +878,64 @@ async def _device_registry_updated(
                         disabled_by=disabled_by,
                     )
 
-    if reload:
-        _LOGGER.info("[%s] Reloading config entry", integration.friendly_name)
-        config_entry = hass.config_entries.async_get_entry(monitored[integration.domain].config_entry_id)
 
-        # Prevent multiple reloads
-        if config_entry.runtime_data.reload_task:
-            config_entry.runtime_data.reload_task.cancel()
+@callback
+def _async_schedule_add_monitor(hass: HomeAssistant, config_entry: ConfigEntry, device_id: str) -> None:
+    """Add the monitor of a new device, without reloading the other ones."""
+    runtime_data: ConfigEntryRuntimeData = config_entry.runtime_data
+
+    # The entry is still setting up and may have listed its devices already, add it once done
+    if not runtime_data.add_device:
+        runtime_data.setup_pending.add(device_id)
+        return
+
+    # Prevent multiple additions of the same device
+    if task := runtime_data.add_tasks.pop(device_id, None):
+        task.cancel()
+
+    # Schedule the addition with a small delay, the integration may still be setting up the device
+    async def delayed_add() -> None:
+        await asyncio.sleep(2)
+        runtime_data.add_tasks.pop(device_id, None)
+
+        device_entry = dr.async_get(hass).async_get(device_id)
+        if not device_entry or device_id in runtime_data.monitored:
+            return
+
+        await runtime_data.add_device(device_entry)
+        _LOGGER.info("[%s] Monitor added for device [%s]", runtime_data.integration.friendly_name, device_entry.name)
+
+    runtime_data.add_tasks[device_id] = config_entry.async_create_background_task(
+        hass, delayed_add(), f"{DOMAIN} add monitor {device_id}"
+    )
+
+
+async def _async_remove_monitor(config_entry: ConfigEntry, device_id: str) -> None:
+    """Stop the monitor of a device, without reloading the other ones."""
+    runtime_data: ConfigEntryRuntimeData = config_entry.runtime_data
+
+    runtime_data.setup_pending.discard(device_id)
+    if task := runtime_data.add_tasks.pop(device_id, None):
+        task.cancel()
+
+    if not (monitored_device := runtime_data.monitored.pop(device_id, None)):
+        return
+
+    for unsub in monitored_device.unsubs:
+        unsub()
+    await monitored_device.coordinator.async_shutdown()
+
+    _LOGGER.info(
+        "[%s] Monitor removed for device [%s]", runtime_data.integration.friendly_name, monitored_device.device.name
+    )
 
-        # Schedule reload with a small delay
-        async def delayed_reload() -> None:
-            await asyncio.sleep(2)
-            await hass.config_entries.async_reload(config_entry.entry_id)
-            _LOGGER.info("[%s] Config entry reloaded!", integration.friendly_name)
 
-        config_entry.runtime_data.reload_task = hass.async_create_task(delayed_reload())
+@callback
+def _async_stop_monitors(config_entry: ConfigEntry) -> None:
+    """Stop the probes of all the monitors of a config entry being unloaded."""
+    for monitored_device in config_entry.runtime_data.monitored.values():
+        for unsub in monitored_device.unsubs:
+            unsub()
 
 
 async def _state_changed(
@@ -599,6 +990,12 @@ def event_changes_has_key(evt: Event, key: str) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    # Hand off the state of the monitors, taken back if the entry is set up again
+    if entry.data.get(CONF_ENTRY_TYPE) in [ENTRY_TYPE_INTEGRATION, ENTRY_TYPE_CUSTOM_GROUP]:
+        hass.data[DATA_CONFIG_KEY].state_handoff.async_put(
+            [monitored_device.coordinator for monitored_device in entry.runtime_data.monitored.values()]
+        )
+
     if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_INTEGRATION:
         domain = entry.data.get(CONF_INTEGRATION)
         hass.data[DATA_CONFIG_KEY].monitored.pop(domain)
@@ -0,0 +1,188 @@
+"""Passive device activity tracking for Device Pulse."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+import logging
+import time
+
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ActivityCallback = Callable[[], None]
+
+
+@dataclass(slots=True)
+class _DeviceActivity:
+    """Activity of a tracked device."""
+
+    subscribers: int = 0
+    watchers: list[ActivityCallback] = field(default_factory=list)
+    last_seen: float | None = None
+    entity_ids: set[str] = field(default_factory=set)
+
+
+class DeviceActivityTracker:
+    """Track the state updates pushed by the entities of the monitored devices.
+
+    A single state changed listener serves all the tracked devices. Events are
+    filtered through an entity to device index, so unrelated state changes are
+    dropped without any lookup in the registries.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._devices: dict[str, _DeviceActivity] = {}
+        self._entity_devices: dict[str, str] = {}
+        self._unsub_listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_track(self, device_id: str) -> CALLBACK_TYPE:
+        """Track the last update of the entities of a device, return a callback to stop."""
+        self._async_subscribe(device_id)
+
+        return partial(self._async_unsubscribe, device_id, None)
+
+    @callback
+    def async_watch(self, device_id: str, action: ActivityCallback) -> CALLBACK_TYPE:
+        """Call action when an entity of the device becomes available, return a callback to stop."""
+        self._async_subscribe(device_id).watchers.append(action)
+
+        return partial(self._async_unsubscribe, device_id, action)
+
+    def is_active(self, device_id: str, max_age: float) -> bool:
+        """Return True if an entity of the device was updated within max_age seconds."""
+        device = self._devices.get(device_id)
+
+        return (
+            device is not None
+            and device.last_seen is not None
+            and time.monotonic() - device.last_seen <= max_age
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening to state changes and drop all the tracked devices."""
+        for unsub in self._unsub_listeners:
+            unsub()
+        self._unsub_listeners.clear()
+        self._devices.clear()
+        self._entity_devices.clear()
+
+    @callback
+    def _async_subscribe(self, device_id: str) -> _DeviceActivity:
+        """Start tracking a device, indexing its entities on the first subscription."""
+        if not self._unsub_listeners:
+            self._async_start()
+
+        if not (device := self._devices.get(device_id)):
+            device = self._devices[device_id] = _DeviceActivity()
+            self._async_index_device(device_id)
+
+        device.subscribers += 1
+
+        return device
+
+    @callback
+    def _async_unsubscribe(self, device_id: str, action: ActivityCallback | None) -> None:
+        """Stop tracking a device, dropping it from the index once unsubscribed."""
+        if not (device := self._devices.get(device_id)):
+            return
+
+        if action is not None and action in device.watchers:
+            device.watchers.remove(action)
+
+        device.subscribers -= 1
+        if device.subscribers > 0:
+            return
+
+        del self._devices[device_id]
+        for entity_id in device.entity_ids:
+            self._entity_devices.pop(entity_id, None)
+
+        if not self._devices:
+            self.async_stop()
+
+    @callback
+    def _async_start(self) -> None:
+        """Register the state changed and entity registry listeners."""
+        self._unsub_listeners = [
+            self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_state_changed,
+                event_filter=self._async_filter_state_changed,
+            ),
+            self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated),
+        ]
+
+    @callback
+    def _async_index_device(self, device_id: str) -> None:
+        """Index the entities of a device, ignoring the ones created by Device Pulse."""
+        entity_registry = er.async_get(self.hass)
+        for entry in er.async_entries_for_device(entity_registry, device_id):
+            if entry.platform != DOMAIN:
+                self._async_index_entity(entry.entity_id, device_id)
+
+    @callback
+    def _async_index_entity(self, entity_id: str, device_id: str) -> None:
+        """Index an entity of a tracked device."""
+        self._entity_devices[entity_id] = device_id
+        self._devices[device_id].entity_ids.add(entity_id)
+
+    @callback
+    def _async_unindex_entity(self, entity_id: str) -> None:
+        """Drop an entity from the index."""
+        if (device_id := self._entity_devices.pop(entity_id, None)) and (device := self._devices.get(device_id)):
+            device.entity_ids.discard(entity_id)
+
+    @callback
+    def _async_filter_state_changed(self, event_data: EventStateChangedData) -> bool:
+        """Drop the state changes of entities not belonging to a tracked device."""
+        return event_data["entity_id"] in self._entity_devices
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Record the update of a device and notify its watchers when it becomes available."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+
+        if new_state is None or new_state.state == STATE_UNAVAILABLE:
+            return
+
+        if not (device_id := self._entity_devices.get(event.data["entity_id"])):
+            return
+        if not (device := self._devices.get(device_id)):
+            return
+
+        device.last_seen = time.monotonic()
+
+        # Only a transition out of unavailable suggests the device is back
+        if old_state is None or old_state.state != STATE_UNAVAILABLE or new_state.state == STATE_UNKNOWN:
+            return
+
+        _LOGGER.debug("Entity [%s] of device [%s] is available again", event.data["entity_id"], device_id)
+        for action in list(device.watchers):
+            action()
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Keep the entity index in sync with the entity registry."""
+        data = event.data
+        self._async_unindex_entity(data["entity_id"])
+        if old_entity_id := data.get("old_entity_id"):
+            self._async_unindex_entity(old_entity_id)
+
+        if data["action"] == "remove":
+            return
+
+        entry = er.async_get(self.hass).async_get(data["entity_id"])
+        if entry and entry.device_id in self._devices and entry.platform != DOMAIN:
+            self._async_index_entity(entry.entity_id, entry.device_id)
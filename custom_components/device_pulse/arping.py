@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 import logging
-from typing import Any
+import socket
+import struct
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.network import Adapter
 from homeassistant.core import HomeAssistant
@@ -12,8 +16,154 @@ from homeassistant.core import HomeAssistant
 from .const import ARP_TIMEOUT
 from .utils import get_network_adapter_for_ip
 
+if TYPE_CHECKING:
+    from .coordinator import DevicePingCoordinator
+
 _LOGGER = logging.getLogger(__name__)
 
+ETH_P_ARP = 0x0806
+ETH_P_IP = 0x0800
+ARP_REQUEST = 1
+ARP_REPLY = 2
+ARP_HEADER = struct.Struct("!HHBBH6s4s6s4s")
+ETH_HEADER_LENGTH = 14
+ETH_MIN_FRAME_LENGTH = 60
+BROADCAST_MAC = b"\xff" * 6
+
+
+class _ArpInterface:
+    """Long-lived AF_PACKET socket bound to a single network interface."""
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Open the socket and start reading ARP replies."""
+        self.hass = hass
+        self.name = name
+        self._sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_ARP))
+        try:
+            self._sock.setblocking(False)
+            self._sock.bind((name, ETH_P_ARP))
+            self.mac: bytes = self._sock.getsockname()[4]
+        except OSError:
+            # The interface may be gone, don't leak the socket
+            self._sock.close()
+            raise
+        self._waiters: dict[str, list[asyncio.Future[int]]] = defaultdict(list)
+        hass.loop.add_reader(self._sock.fileno(), self._read_replies)
+
+    def close(self) -> None:
+        """Close the socket and release all waiters."""
+        self.hass.loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                waiter.cancel()
+        self._waiters.clear()
+
+    def add_waiter(self, ip_address: str) -> asyncio.Future[int]:
+        """Return a future resolved with the receive time (ns) of the next reply from ip_address."""
+        waiter = self.hass.loop.create_future()
+        self._waiters[ip_address].append(waiter)
+        return waiter
+
+    def remove_waiter(self, ip_address: str, waiter: asyncio.Future[int]) -> None:
+        """Drop a waiter that is no longer interested in a reply."""
+        if (waiters := self._waiters.get(ip_address)) and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[ip_address]
+
+    def send_request(self, source_ip: str, target_ip: str) -> int:
+        """Broadcast an ARP request for target_ip and return the send time (ns)."""
+        frame = (
+            BROADCAST_MAC
+            + self.mac
+            + struct.pack("!H", ETH_P_ARP)
+            + ARP_HEADER.pack(
+                1,
+                ETH_P_IP,
+                6,
+                4,
+                ARP_REQUEST,
+                self.mac,
+                socket.inet_aton(source_ip),
+                b"\x00" * 6,
+                socket.inet_aton(target_ip),
+            )
+        )
+        self._sock.send(frame.ljust(ETH_MIN_FRAME_LENGTH, b"\x00"))
+        return time.perf_counter_ns()
+
+    def _read_replies(self) -> None:
+        """Drain the socket and resolve the waiters of every replying host."""
+        while True:
+            try:
+                frame = self._sock.recv(ETH_MIN_FRAME_LENGTH + 4)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as err:
+                _LOGGER.debug("ARP receive error on %s: %s", self.name, err)
+                return
+
+            received_at = time.perf_counter_ns()
+
+            arp = frame[ETH_HEADER_LENGTH:ETH_HEADER_LENGTH + ARP_HEADER.size]
+            if len(arp) < ARP_HEADER.size:
+                continue
+
+            *_, operation, _, sender_ip, _, _ = ARP_HEADER.unpack(arp)
+            if operation != ARP_REPLY:
+                continue
+
+            for waiter in self._waiters.pop(socket.inet_ntoa(sender_ip), []):
+                if not waiter.done():
+                    waiter.set_result(received_at)
+
+
+class ArpProber:
+    """Send ARP requests and read replies on one long-lived socket per interface."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the prober."""
+        self.hass = hass
+        self._interfaces: dict[str, _ArpInterface] = {}
+
+    def stop(self) -> None:
+        """Close all the interface sockets."""
+        for interface in self._interfaces.values():
+            interface.close()
+        self._interfaces.clear()
+
+    def get_interface(self, name: str) -> _ArpInterface:
+        """Return the socket for an interface, opening it on first use."""
+        if not (interface := self._interfaces.get(name)):
+            interface = self._interfaces[name] = _ArpInterface(self.hass, name)
+            _LOGGER.debug("Opened ARP socket on interface %s", name)
+        return interface
+
+    async def async_probe(
+        self, interface_name: str, source_ip: str, target_ip: str, count: int = 1, timeout: float = ARP_TIMEOUT
+    ) -> float | None:
+        """Probe target_ip and return the response time (ms) of the first reply.
+
+        Up to count requests are sent, one per timeout window, stopping on the
+        first reply like arping -f does.
+        """
+        interface = self.get_interface(interface_name)
+
+        for _ in range(count):
+            waiter = interface.add_waiter(target_ip)
+            try:
+                sent_at = interface.send_request(source_ip, target_ip)
+                received_at = await asyncio.wait_for(waiter, timeout)
+            except (asyncio.TimeoutError, OSError):
+                interface.remove_waiter(target_ip, waiter)
+                continue
+            # Microsecond resolution response time, expressed in milliseconds
+            return round((received_at - sent_at) / 1_000_000, 3)
+
+        return None
+
+
 class PingDataARP:
     """Handle ARP ping requests."""
 
@@ -105,3 +255,179 @@ class PingDataARP:
         return data
 
 
+class PingDataARPSocket(PingDataARP):
+    """Handle ARP ping requests through native AF_PACKET sockets."""
+
+    def __init__(
+        self, hass: HomeAssistant, ip_address: str, count: int, prober: ArpProber, fallback: bool = False
+    ) -> None:
+        """Initialize the ARP ping handler."""
+        super().__init__(hass, ip_address, count)
+        self._prober = prober
+        self._fallback = fallback
+        self._source_ip: str | None = None
+
+    async def async_update(self) -> None:
+        """Send ARP requests on the interface socket to check if the host is alive."""
+        if not self._adapter:
+            self._adapter, self._source_ip, _ = await get_network_adapter_for_ip(self.hass, self.ip_address)
+
+        if not self._adapter:
+            self.is_alive = False
+            self.data = None
+            _LOGGER.debug("ARP ping to %s failed: no network adapter found", self.ip_address)
+            return
+
+        try:
+            response_time = await self._prober.async_probe(
+                self._adapter.get("name"), self._source_ip, self.ip_address, self.count
+            )
+        except OSError as err:
+            # Missing capability or interface, fall back to the arping command if possible
+            if self._fallback:
+                _LOGGER.debug("ARP socket unavailable for %s, using arping: %s", self.ip_address, err)
+                await super().async_update()
+                return
+            _LOGGER.error("Error during ARP ping to %s: %s", self.ip_address, err)
+            response_time = None
+
+        self.is_alive = response_time is not None
+        self.data = (
+            {"min": response_time, "max": response_time, "avg": response_time}
+            if self.is_alive
+            else None
+        )
+        if not self.is_alive:
+            _LOGGER.debug("ARP ping to %s failed (no reply)", self.ip_address)
+
+
+class PingDataARPSweep(PingDataARPSocket):
+    """Handle ARP ping requests answered by a subnet-wide ARP sweep."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the ARP ping handler."""
+        super().__init__(*args, **kwargs)
+        self._sweep_available = False
+        self._sweep_response_time: float | None = None
+
+    def set_sweep_result(self, response_time: float | None) -> None:
+        """Store the result collected by the last sweep for the next update."""
+        self._sweep_available = True
+        self._sweep_response_time = response_time
+
+    async def async_update(self) -> None:
+        """Consume the last sweep result, probing the host alone if none is available."""
+        if not self._sweep_available:
+            await super().async_update()
+            return
+
+        response_time = self._sweep_response_time
+        self._sweep_available = False
+
+        self.is_alive = response_time is not None
+        self.data = (
+            {"min": response_time, "max": response_time, "avg": response_time}
+            if self.is_alive
+            else None
+        )
+
+
+class ArpSweep:
+    """Probe all the ARP monitors of an interface with a single burst per interval.
+
+    Requests for every target are broadcast back-to-back and all the replies
+    are collected within the same timeout window, so the duration of a round
+    depends on the timeout only and not on the number of devices.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, prober: ArpProber, interface_name: str, source_ip: str, count: int = 1
+    ) -> None:
+        """Initialize the sweep."""
+        self.hass = hass
+        self.interface_name = interface_name
+        self.source_ip = source_ip
+        self.count = count
+        self._prober = prober
+        self._coordinators: list[DevicePingCoordinator] = []
+
+    @property
+    def packets(self) -> int:
+        """Return the maximum number of requests sent by a sweep."""
+        return len(self._coordinators) * self.count
+
+    def add(self, coordinator: DevicePingCoordinator) -> None:
+        """Add the monitor of a coordinator using a PingDataARPSweep to the sweep."""
+        self._coordinators.append(coordinator)
+
+    def remove(self, coordinator: DevicePingCoordinator) -> None:
+        """Remove the monitor of a coordinator from the sweep."""
+        if coordinator in self._coordinators:
+            self._coordinators.remove(coordinator)
+
+    async def async_run(self) -> None:
+        """Run a sweep and refresh all the coordinators with its results."""
+        # Offline devices in backoff skip some of the sweeps
+        if not (coordinators := [coordinator for coordinator in self._coordinators if coordinator.is_probe_due()]):
+            return
+
+        # Devices recently seen alive are refreshed without being probed
+        swept = [coordinator for coordinator in coordinators if not coordinator.is_passively_alive()]
+        results = await self.async_sweep([coordinator.ping.ip_address for coordinator in swept]) if swept else {}
+
+        for coordinator in swept:
+            coordinator.ping.set_sweep_result(results.get(coordinator.ping.ip_address))
+
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+    async def async_sweep(self, targets: list[str]) -> dict[str, float | None]:
+        """Probe all the targets and return the response time (ms) of each one."""
+        results: dict[str, float | None] = dict.fromkeys(targets)
+
+        try:
+            interface = self._prober.get_interface(self.interface_name)
+        except OSError as err:
+            _LOGGER.error("Unable to open ARP socket on %s: %s", self.interface_name, err)
+            return results
+
+        pending = list(results)
+
+        for _ in range(self.count):
+            waiters: dict[asyncio.Future[int], tuple[str, int]] = {}
+
+            # Broadcast the requests for all the targets in a tight burst
+            for ip_address in pending:
+                waiter = interface.add_waiter(ip_address)
+                try:
+                    waiters[waiter] = (ip_address, interface.send_request(self.source_ip, ip_address))
+                except OSError as err:
+                    _LOGGER.debug("ARP request to %s failed: %s", ip_address, err)
+                    interface.remove_waiter(ip_address, waiter)
+
+            if not waiters:
+                break
+
+            # Collect all the replies within one timeout window
+            done, not_done = await asyncio.wait(waiters, timeout=ARP_TIMEOUT)
+
+            for waiter in done:
+                if waiter.cancelled():
+                    continue
+                ip_address, sent_at = waiters[waiter]
+                results[ip_address] = round((waiter.result() - sent_at) / 1_000_000, 3)
+
+            for waiter in not_done:
+                interface.remove_waiter(waiters[waiter][0], waiter)
+                waiter.cancel()
+
+            if not (pending := [ip_address for ip_address in pending if results[ip_address] is None]):
+                break
+
+        _LOGGER.debug(
+            "ARP sweep on %s: %d/%d hosts replied",
+            self.interface_name,
+            sum(result is not None for result in results.values()),
+            len(results),
+        )
+
+        return results
@@ -3,11 +3,12 @@
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import ConfigEntryRuntimeData
-from .const import CONF_ENTRY_TYPE, ENTRY_TYPE_NETWORK_SUMMARY
+from . import ConfigEntryRuntimeData, ConfigMonitoredDeviceData
+from .const import CONF_ENTRY_TYPE, ENTRY_TYPE_NETWORK_SUMMARY, SIGNAL_MONITOR_ADDED
 from .entities import DevicePingStatusBinarySensor
 from .network_status import AllDevicesOnlineStatusSensor
 from .utils import remove_config_entry_orphan_entities
@@ -28,14 +29,25 @@ async def async_setup_entry(
         async_add_entities([AllDevicesOnlineStatusSensor(hass)])
         return
 
+    integration = config_entry.runtime_data.integration
+
     entities = [
-        DevicePingStatusBinarySensor(monitored.coordinator, monitored.device, config_entry.runtime_data.integration)
+        DevicePingStatusBinarySensor(monitored.coordinator, monitored.device, integration)
         for monitored in config_entry.runtime_data.monitored.values()
     ]
 
     if entities:
         async_add_entities(entities)
 
+    @callback
+    def _async_monitor_added(monitored: ConfigMonitoredDeviceData) -> None:
+        """Add the entities of a monitor created after the setup."""
+        async_add_entities([DevicePingStatusBinarySensor(monitored.coordinator, monitored.device, integration)])
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_MONITOR_ADDED.format(config_entry.entry_id), _async_monitor_added)
+    )
+
     # Clean up orphan entities
     remove_config_entry_orphan_entities(
         hass, config_entry, entities, "binary_sensor"
@@ -0,0 +1,74 @@
+"""Global probe budget for Device Pulse."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+
+from .const import DEFAULT_MAX_PACKETS_PER_SECOND, DEFAULT_MAX_PROBES_IN_FLIGHT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ProbeBudget:
+    """Limit the probes in flight and the packets sent per second.
+
+    Packets are accounted with a token bucket refilled at the configured rate,
+    holding at most one second worth of packets.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_PROBES_IN_FLIGHT,
+        max_packets_per_second: int = DEFAULT_MAX_PACKETS_PER_SECOND,
+    ) -> None:
+        """Initialize the budget."""
+        self.max_in_flight = max_in_flight
+        self.max_packets_per_second = max_packets_per_second
+        self.in_flight = 0
+        self._tokens = float(max_packets_per_second)
+        self._refilled_at = time.monotonic()
+
+    def configure(self, max_in_flight: int, max_packets_per_second: int) -> None:
+        """Update the budget limits."""
+        self.max_in_flight = max_in_flight
+        self.max_packets_per_second = max_packets_per_second
+        self._tokens = min(self._tokens, float(max_packets_per_second))
+        _LOGGER.debug(
+            "Probe budget set to %d probes in flight, %d packets/s", max_in_flight, max_packets_per_second
+        )
+
+    def try_acquire(self, packets: int) -> float:
+        """Try to reserve a probe sending packets.
+
+        Returns 0 when the probe can start, otherwise the seconds to wait
+        before retrying (infinite when limited by the probes in flight).
+        """
+        if self.in_flight >= self.max_in_flight:
+            return math.inf
+
+        self._refill()
+
+        # A probe larger than the bucket can start once the bucket is full
+        packets = min(packets, self.max_packets_per_second)
+        if self._tokens < packets:
+            return (packets - self._tokens) / self.max_packets_per_second
+
+        self._tokens -= packets
+        self.in_flight += 1
+
+        return 0
+
+    def release(self) -> None:
+        """Release a probe reserved with try_acquire."""
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def _refill(self) -> None:
+        """Refill the token bucket based on the elapsed time."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.max_packets_per_second),
+            self._tokens + (now - self._refilled_at) * self.max_packets_per_second,
+        )
+        self._refilled_at = now
@@ -0,0 +1,204 @@
+"""Catalog of the integrations valid for monitoring for Device Pulse."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+import logging
+
+from homeassistant.components import zeroconf
+from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED, ConfigEntry, ConfigEntryChange
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, SETUP_MAX_CONCURRENCY, SETUP_RAMP_UP_DELAY
+from .utils import (
+    IntegrationData,
+    async_get_integration_name,
+    async_run_bounded,
+    extract_device_host,
+    is_device_valid_for_monitoring,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_INTEGRATION_CATALOG: HassKey[IntegrationCatalog] = HassKey(f"{DOMAIN}_integration_catalog")
+
+
+class IntegrationCatalog:
+    """Integrations having devices with a host, with their device count.
+
+    Integrations are scanned on first use only: the monitored ones when their
+    config entries are set up, and all of them when a config flow lists them.
+    Afterwards, the device registry and config entry events update the devices
+    of the scanned integrations one at a time, without scanning the whole
+    registry again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the catalog."""
+        self.hass = hass
+        self.integrations: dict[str, IntegrationData] = {}
+        self._devices: dict[str, str] = {}
+        self._scanned_domains: set[str] = set()
+        self._fully_scanned = False
+        self._entries_modified_at: dict[str, datetime] = {}
+        self._lock = asyncio.Lock()
+
+    @callback
+    def async_start(self) -> None:
+        """Listen to the device registry and config entry changes."""
+        self.hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated)
+        async_dispatcher_connect(self.hass, SIGNAL_CONFIG_ENTRY_CHANGED, self._async_config_entry_changed)
+
+    async def async_get_integrations(self) -> dict[str, IntegrationData]:
+        """Return all the integrations with devices valid for monitoring, scanning the ones not scanned yet."""
+        async with self._lock:
+            if not self._fully_scanned:
+                await self._async_scan(lambda domain: domain not in self._scanned_domains)
+                self._fully_scanned = True
+
+        integrations = {domain: integration for domain, integration in self.integrations.items() if integration.device_count}
+        _LOGGER.debug(
+            "Found %d valid integrations for monitoring: %s",
+            len(integrations),
+            [integration.friendly_name for integration in integrations.values()],
+        )
+
+        return integrations
+
+    async def async_get_integration(self, domain: str) -> IntegrationData | None:
+        """Return an integration valid for monitoring, scanning only its devices on first use."""
+        async with self._lock:
+            if not self._is_scanned(domain):
+                await self._async_scan(lambda device_domain: device_domain == domain)
+                self._scanned_domains.add(domain)
+
+        return self.integrations.get(domain)
+
+    @callback
+    def async_add_fallback(self, integration: IntegrationData) -> None:
+        """Add an integration without devices valid for monitoring."""
+        self.integrations.setdefault(integration.domain, integration)
+
+    def _is_scanned(self, domain: str) -> bool:
+        """Return True if the devices of the integration are in the catalog."""
+        return self._fully_scanned or domain in self._scanned_domains
+
+    async def _async_scan(self, domain_filter: Callable[[str], bool]) -> None:
+        """Add the devices with a host of the integrations matching the filter."""
+        device_registry = dr.async_get(self.hass)
+        devices: list[tuple[dr.DeviceEntry, ConfigEntry]] = []
+
+        for device in device_registry.devices.values():
+            if not device.primary_config_entry:
+                continue
+            if not (entry := self.hass.config_entries.async_get_entry(device.primary_config_entry)):
+                continue
+            if domain_filter(entry.domain) and is_device_valid_for_monitoring(self.hass, device_registry, device):
+                devices.append((device, entry))
+                self._entries_modified_at[entry.entry_id] = entry.modified_at
+
+        zc = await zeroconf.async_get_instance(self.hass)
+
+        async def _async_scan_device(device_and_entry: tuple[dr.DeviceEntry, ConfigEntry]) -> None:
+            device, entry = device_and_entry
+            host, _ = await extract_device_host(self.hass, device, zc, entry)
+            if host:
+                await self._async_add_device(device.id, entry.domain)
+
+        # Extract the hosts with a bounded concurrency, so zeroconf queries don't wait for each other
+        await async_run_bounded(_async_scan_device, devices, SETUP_MAX_CONCURRENCY, SETUP_RAMP_UP_DELAY)
+
+    async def _async_update_device(self, device_id: str) -> None:
+        """Add or remove a device after a change of the device or its config entry."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get(device_id)
+        entry = (
+            self.hass.config_entries.async_get_entry(device.primary_config_entry)
+            if device and device.primary_config_entry
+            else None
+        )
+
+        if (
+            not device
+            or not entry
+            or not self._is_scanned(entry.domain)
+            or not is_device_valid_for_monitoring(self.hass, device_registry, device)
+        ):
+            self._async_remove_device(device_id)
+            return
+
+        zc = await zeroconf.async_get_instance(self.hass)
+        host, _ = await extract_device_host(self.hass, device, zc, entry)
+
+        if host:
+            await self._async_add_device(device_id, entry.domain)
+        else:
+            self._async_remove_device(device_id)
+
+    async def _async_add_device(self, device_id: str, domain: str) -> None:
+        """Count a device with a host in its integration."""
+        if self._devices.get(device_id) == domain:
+            return
+
+        if domain not in self.integrations:
+            friendly_name = await async_get_integration_name(self.hass, domain)
+            self.integrations.setdefault(domain, IntegrationData(domain, friendly_name, 0, False))
+
+        self._async_remove_device(device_id)
+        self._devices[device_id] = domain
+        self.integrations[domain].device_count += 1
+
+    @callback
+    def _async_remove_device(self, device_id: str) -> None:
+        """Stop counting a device.
+
+        An integration left without devices is kept, with a count of zero, as
+        the running config entries hold its data.
+        """
+        if not (domain := self._devices.pop(device_id, None)) or not (integration := self.integrations.get(domain)):
+            return
+
+        integration.device_count = max(integration.device_count - 1, 0)
+
+    @callback
+    def _async_device_registry_updated(self, event: Event[dr.EventDeviceRegistryUpdatedData]) -> None:
+        """Update the catalog when a device is created, updated or removed."""
+        device_id = event.data["device_id"]
+
+        if event.data["action"] == "remove":
+            self._async_remove_device(device_id)
+            return
+
+        self.hass.async_create_background_task(
+            self._async_update_device(device_id), f"{DOMAIN} catalog update {device_id}"
+        )
+
+    @callback
+    def _async_config_entry_changed(self, change: ConfigEntryChange, entry: ConfigEntry) -> None:
+        """Update the devices of a config entry when its configuration was modified."""
+        # State changes of the entry don't change the hosts of its devices
+        if change != ConfigEntryChange.UPDATED or not self._is_scanned(entry.domain):
+            return
+        if self._entries_modified_at.get(entry.entry_id) == entry.modified_at:
+            return
+
+        self._entries_modified_at[entry.entry_id] = entry.modified_at
+        for device in dr.async_entries_for_config_entry(dr.async_get(self.hass), entry.entry_id):
+            self.hass.async_create_background_task(
+                self._async_update_device(device.id), f"{DOMAIN} catalog update {device.id}"
+            )
+
+
+@callback
+@singleton(DATA_INTEGRATION_CATALOG)
+def async_get_integration_catalog(hass: HomeAssistant) -> IntegrationCatalog:
+    """Return the catalog shared by the setup and the config flows."""
+    catalog = IntegrationCatalog(hass)
+    catalog.async_start()
+    return catalog
@@ -8,12 +8,12 @@ from typing import Any, Protocol, runtime_checkable
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.components import zeroconf
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
 import homeassistant.helpers.device_registry as dr
 from homeassistant.util import uuid
 
+from .catalog import async_get_integration_catalog
 from .const import (
     CONF_DEVICE_SELECTION_MODE,
     CONF_ENTRY_TYPE,
@@ -22,6 +22,17 @@ from .const import (
     CONF_PING_REQUESTS_PER_ATTEMPT,
     CONF_PING_INTERVAL,
     CONF_PING_METHOD,
+    CONF_PROBE_PRIORITY,
+    CONF_SUSPICION_RETRY_INTERVAL,
+    CONF_OFFLINE_BACKOFF_MAX_INTERVAL,
+    CONF_OFFLINE_BACKOFF_FAST_PATH,
+    CONF_PING_ESCALATE_REQUESTS,
+    CONF_SKIP_REACHABLE_NEIGHBORS,
+    CONF_PASSIVE_LIVENESS,
+    CONF_TCP_PORT,
+    CONF_RESTORE_STATE_ON_STARTUP,
+    CONF_MAX_PACKETS_PER_SECOND,
+    CONF_MAX_PROBES_IN_FLIGHT,
     CONF_SELECTED_DEVICES,
     CONF_SENSORS_INTEGRATION_SUMMARY_ENABLED,
     CONF_SENSORS_DISCONNECTED_SINCE_ENABLED,
@@ -37,6 +48,17 @@ from .const import (
     DEFAULT_PING_REQUESTS_PER_ATTEMPT,
     DEFAULT_PING_INTERVAL,
     DEFAULT_PING_METHOD,
+    DEFAULT_PROBE_PRIORITY,
+    DEFAULT_SUSPICION_RETRY_INTERVAL,
+    DEFAULT_OFFLINE_BACKOFF_MAX_INTERVAL,
+    DEFAULT_OFFLINE_BACKOFF_FAST_PATH,
+    DEFAULT_PING_ESCALATE_REQUESTS,
+    DEFAULT_SKIP_REACHABLE_NEIGHBORS,
+    DEFAULT_PASSIVE_LIVENESS,
+    DEFAULT_TCP_PORT,
+    DEFAULT_RESTORE_STATE_ON_STARTUP,
+    DEFAULT_MAX_PACKETS_PER_SECOND,
+    DEFAULT_MAX_PROBES_IN_FLIGHT,
     DEFAULT_SENSORS_INTEGRATION_SUMMARY_ENABLED,
     DEFAULT_SENSORS_DISCONNECTED_SINCE_ENABLED,
     DEFAULT_SENSORS_FAILED_PINGS_ENABLED,
@@ -50,7 +72,13 @@ from .const import (
     ENTRY_TYPE_NETWORK_SUMMARY,
     NETWORK_SUMMARY_ENTRY_ID,
     PING_METHOD_ARP,
+    PING_METHOD_ARP_SWEEP,
     PING_METHOD_ICMP,
+    PING_METHOD_TCP,
+    PING_METHOD_HTTP,
+    PROBE_PRIORITY_BEST_EFFORT,
+    PROBE_PRIORITY_CRITICAL,
+    PROBE_PRIORITY_NORMAL,
 )
 from .utils import (
     IntegrationData,
@@ -58,7 +86,6 @@ from .utils import (
     check_integration_devices_support_arp_ping,
     format_duration,
     get_integration_devices_valid,
-    get_valid_integrations_for_monitoring,
     is_valid_hostname_or_ip,
 )
 
@@ -67,6 +94,14 @@ GROUP_EDIT_REMOVE_DEVICES = "group_edit_remove_devices"
 GROUP_EDIT_UPDATE_DEVICE = "group_edit_update_device"
 GROUP_EDIT_CHANGE_SETTING = "group_edit_change_settings"
 
+PING_METHOD_LABELS = {
+    PING_METHOD_ICMP: "ICMP Ping",
+    PING_METHOD_ARP: "ARP Ping",
+    PING_METHOD_ARP_SWEEP: "ARP Sweep",
+    PING_METHOD_TCP: "TCP Connect",
+    PING_METHOD_HTTP: "HTTP(S) Request",
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 @runtime_checkable
@@ -106,6 +141,15 @@ class DevicePingMonitorBaseFlow(abc.ABC, _FlowProtocol):
     ping_requests_per_attempt: int = DEFAULT_PING_REQUESTS_PER_ATTEMPT
     ping_interval: int = DEFAULT_PING_INTERVAL
     ping_method: str = DEFAULT_PING_METHOD
+    probe_priority: str = DEFAULT_PROBE_PRIORITY
+    suspicion_retry_interval: int = DEFAULT_SUSPICION_RETRY_INTERVAL
+    offline_backoff_max_interval: int = DEFAULT_OFFLINE_BACKOFF_MAX_INTERVAL
+    offline_backoff_fast_path: bool = DEFAULT_OFFLINE_BACKOFF_FAST_PATH
+    ping_escalate_requests: bool = DEFAULT_PING_ESCALATE_REQUESTS
+    skip_reachable_neighbors: bool = DEFAULT_SKIP_REACHABLE_NEIGHBORS
+    passive_liveness: bool = DEFAULT_PASSIVE_LIVENESS
+    tcp_port: int = DEFAULT_TCP_PORT
+    restore_state_on_startup: bool = DEFAULT_RESTORE_STATE_ON_STARTUP
     sensors_integration_summary_enabled = DEFAULT_SENSORS_INTEGRATION_SUMMARY_ENABLED
     sensors_failed_pings_enabled = DEFAULT_SENSORS_FAILED_PINGS_ENABLED
     sensors_disconnected_since_enabled = DEFAULT_SENSORS_DISCONNECTED_SINCE_ENABLED
@@ -121,14 +165,22 @@ class DevicePingMonitorBaseFlow(abc.ABC, _FlowProtocol):
             self.ping_interval = int(user_input[CONF_PING_INTERVAL])
             self.ping_method = user_input[CONF_PING_METHOD]
 
-            return await self.async_step_monitor_sensors()
+            return await self.async_step_monitor_advanced()
 
         # Build ping method options
         ping_options = [
             selector.SelectOptionDict(
                 value=PING_METHOD_ICMP,
                 label="ICMP Ping (Standard)",
-            )
+            ),
+            selector.SelectOptionDict(
+                value=PING_METHOD_TCP,
+                label="TCP Connect (Hosts Dropping ICMP)",
+            ),
+            selector.SelectOptionDict(
+                value=PING_METHOD_HTTP,
+                label="HTTP(S) Request (Devices with a Web Interface)",
+            ),
         ]
 
         # Build description with a warning if ARP is not available
@@ -144,13 +196,21 @@ class DevicePingMonitorBaseFlow(abc.ABC, _FlowProtocol):
                     label="ARP Ping (Local Subnet Only)",
                 )
             )
+            ping_options.append(
+                selector.SelectOptionDict(
+                    value=PING_METHOD_ARP_SWEEP,
+                    label="ARP Sweep (Local Subnet Only, all devices at once)",
+                )
+            )
         else:
             # Force ICMP if ARP not supported
-            self.ping_method = PING_METHOD_ICMP
+            if self.ping_method in (PING_METHOD_ARP, PING_METHOD_ARP_SWEEP):
+                self.ping_method = PING_METHOD_ICMP
 
             if self.integration_arp_unavailable_reason == "arping_not_installed":
                 description_placeholders["arp_warning"] = (
-                    "\n\n⚠️ **ARP Ping is not available**: The `arping` command is not installed on your system. "
+                    "\n\n⚠️ **ARP Ping is not available**: Home Assistant cannot open raw ARP sockets and "
+                    "the `arping` command is not installed on your system. "
                     "Install the `iputils-arping` package to enable ARP ping functionality."
                 )
             elif self.integration_arp_unavailable_reason == "no_local_devices":
@@ -217,6 +277,95 @@ class DevicePingMonitorBaseFlow(abc.ABC, _FlowProtocol):
             last_step=False,
         )
 
+    async def async_step_monitor_advanced(self, user_input: dict[str, Any] | None = None):
+        """Handle the advanced monitoring parameters step."""
+        if user_input is not None:
+            self.probe_priority = user_input[CONF_PROBE_PRIORITY]
+            self.suspicion_retry_interval = int(user_input[CONF_SUSPICION_RETRY_INTERVAL])
+            self.offline_backoff_max_interval = int(user_input[CONF_OFFLINE_BACKOFF_MAX_INTERVAL])
+            self.offline_backoff_fast_path = bool(user_input[CONF_OFFLINE_BACKOFF_FAST_PATH])
+            self.ping_escalate_requests = bool(user_input[CONF_PING_ESCALATE_REQUESTS])
+            self.skip_reachable_neighbors = bool(user_input[CONF_SKIP_REACHABLE_NEIGHBORS])
+            self.passive_liveness = bool(user_input[CONF_PASSIVE_LIVENESS])
+            self.tcp_port = int(user_input.get(CONF_TCP_PORT, self.tcp_port))
+            self.restore_state_on_startup = bool(user_input[CONF_RESTORE_STATE_ON_STARTUP])
+
+            return await self.async_step_monitor_sensors()
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_PROBE_PRIORITY, default=self.probe_priority
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[PROBE_PRIORITY_CRITICAL, PROBE_PRIORITY_NORMAL, PROBE_PRIORITY_BEST_EFFORT],
+                        translation_key=CONF_PROBE_PRIORITY,
+                        mode=selector.SelectSelectorMode.LIST,
+                    )
+                ),
+                vol.Required(
+                    CONF_SUSPICION_RETRY_INTERVAL, default=self.suspicion_retry_interval
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=300,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                        unit_of_measurement="seconds",
+                    )
+                ),
+                vol.Required(
+                    CONF_OFFLINE_BACKOFF_MAX_INTERVAL, default=self.offline_backoff_max_interval
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=86400,
+                        step=60,
+                        mode=selector.NumberSelectorMode.BOX,
+                        unit_of_measurement="seconds",
+                    )
+                ),
+                vol.Required(
+                    CONF_OFFLINE_BACKOFF_FAST_PATH, default=self.offline_backoff_fast_path
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_PING_ESCALATE_REQUESTS, default=self.ping_escalate_requests
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_SKIP_REACHABLE_NEIGHBORS, default=self.skip_reachable_neighbors
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_PASSIVE_LIVENESS, default=self.passive_liveness
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_RESTORE_STATE_ON_STARTUP, default=self.restore_state_on_startup
+                ): selector.BooleanSelector(),
+            }
+        )
+
+        # The port is only used by the TCP connect method
+        if self.ping_method == PING_METHOD_TCP:
+            data_schema = data_schema.extend(
+                {
+                    vol.Required(
+                        CONF_TCP_PORT, default=self.tcp_port
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=65535,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                }
+            )
+
+        return self.async_show_form(
+            step_id="monitor_advanced",
+            data_schema=data_schema,
+            last_step=False,
+        )
+
     async def async_step_monitor_sensors(self, user_input: dict[str, Any] | None = None):
         """Handle the sensors options step."""
         if user_input is not None:
@@ -455,10 +604,10 @@ class DevicePingMonitorBaseFlow(abc.ABC, _FlowProtocol):
         sensors_summary = self._get_sensors_summary()
 
         detection_time = self._calculate_detection_time(
-            self.ping_attempts_before_failure, self.ping_interval
+            self.ping_attempts_before_failure, self.ping_interval, self.suspicion_retry_interval
         )
 
-        ping_method_label = "ICMP Ping" if self.ping_method == PING_METHOD_ICMP else "ARP Ping"
+        ping_method_label = PING_METHOD_LABELS.get(self.ping_method, self.ping_method)
 
         data_schema = vol.Schema({})
 
@@ -484,10 +633,14 @@ class DevicePingMonitorBaseFlow(abc.ABC, _FlowProtocol):
 
     @staticmethod
     def _calculate_detection_time(
-        ping_attempts_before_failure: int, ping_interval: int
+        ping_attempts_before_failure: int, ping_interval: int, suspicion_retry_interval: int = 0
     ) -> str:
         """Calculate the offline detection time."""
-        total_seconds = ping_attempts_before_failure * ping_interval
+        # After the first failure, confirmation probes replace the regular ones
+        if 0 < suspicion_retry_interval < ping_interval:
+            total_seconds = ping_interval + (ping_attempts_before_failure - 1) * suspicion_retry_interval
+        else:
+            total_seconds = ping_attempts_before_failure * ping_interval
 
         return format_duration(total_seconds)
 
@@ -592,10 +745,10 @@ class DevicePingMonitorBaseFlow(abc.ABC, _FlowProtocol):
         sensors_summary = self._get_sensors_summary()
 
         detection_time = self._calculate_detection_time(
-            self.ping_attempts_before_failure, self.ping_interval
+            self.ping_attempts_before_failure, self.ping_interval, self.suspicion_retry_interval
         )
 
-        ping_method_label = "ICMP Ping" if self.ping_method == PING_METHOD_ICMP else "ARP Ping"
+        ping_method_label = PING_METHOD_LABELS.get(self.ping_method, self.ping_method)
 
         data_schema = vol.Schema({})
 
@@ -665,8 +818,7 @@ class DevicePingMonitorConfigFlow(
     async def async_step_integration_choice(self, user_input: dict[str, Any] | None = None):
         errors = {}
 
-        zc = await zeroconf.async_get_instance(self.hass)
-        self.available_integrations = await get_valid_integrations_for_monitoring(self.hass, zc)
+        self.available_integrations = await async_get_integration_catalog(self.hass).async_get_integrations()
         _LOGGER.info("Step Integration Choice: Found %d valid integrations for monitoring: %s",
             len(self.available_integrations),
             [integration.friendly_name for integration in self.available_integrations.values()]
@@ -756,6 +908,15 @@ class DevicePingMonitorConfigFlow(
                 CONF_PING_REQUESTS_PER_ATTEMPT: self.ping_requests_per_attempt,
                 CONF_PING_INTERVAL: self.ping_interval,
                 CONF_PING_METHOD: self.ping_method,
+                CONF_PROBE_PRIORITY: self.probe_priority,
+                CONF_SUSPICION_RETRY_INTERVAL: self.suspicion_retry_interval,
+                CONF_OFFLINE_BACKOFF_MAX_INTERVAL: self.offline_backoff_max_interval,
+                CONF_OFFLINE_BACKOFF_FAST_PATH: self.offline_backoff_fast_path,
+                CONF_PING_ESCALATE_REQUESTS: self.ping_escalate_requests,
+                CONF_SKIP_REACHABLE_NEIGHBORS: self.skip_reachable_neighbors,
+                CONF_PASSIVE_LIVENESS: self.passive_liveness,
+                CONF_TCP_PORT: self.tcp_port,
+                CONF_RESTORE_STATE_ON_STARTUP: self.restore_state_on_startup,
                 CONF_DEVICE_SELECTION_MODE: self.integration_device_selection_mode,
                 CONF_SENSORS_INTEGRATION_SUMMARY_ENABLED: self.sensors_integration_summary_enabled,
                 CONF_SENSORS_FAILED_PINGS_ENABLED: self.sensors_failed_pings_enabled,
@@ -778,6 +939,15 @@ class DevicePingMonitorConfigFlow(
                 CONF_PING_REQUESTS_PER_ATTEMPT: self.ping_requests_per_attempt,
                 CONF_PING_INTERVAL: self.ping_interval,
                 CONF_PING_METHOD: self.ping_method,
+                CONF_PROBE_PRIORITY: self.probe_priority,
+                CONF_SUSPICION_RETRY_INTERVAL: self.suspicion_retry_interval,
+                CONF_OFFLINE_BACKOFF_MAX_INTERVAL: self.offline_backoff_max_interval,
+                CONF_OFFLINE_BACKOFF_FAST_PATH: self.offline_backoff_fast_path,
+                CONF_PING_ESCALATE_REQUESTS: self.ping_escalate_requests,
+                CONF_SKIP_REACHABLE_NEIGHBORS: self.skip_reachable_neighbors,
+                CONF_PASSIVE_LIVENESS: self.passive_liveness,
+                CONF_TCP_PORT: self.tcp_port,
+                CONF_RESTORE_STATE_ON_STARTUP: self.restore_state_on_startup,
                 CONF_SENSORS_INTEGRATION_SUMMARY_ENABLED: self.sensors_integration_summary_enabled,
                 CONF_SENSORS_FAILED_PINGS_ENABLED: self.sensors_failed_pings_enabled,
                 CONF_SENSORS_DISCONNECTED_SINCE_ENABLED: self.sensors_disconnected_since_enabled,
@@ -793,7 +963,7 @@ class DevicePingMonitorConfigFlow(
 
 
 class DevicePingMonitorOptionsFlow(
-    config_entries.OptionsFlowWithReload, DevicePingMonitorBaseFlow
+    config_entries.OptionsFlow, DevicePingMonitorBaseFlow
 ):
     """Handle an options flow for Device Pulse."""
 
@@ -805,19 +975,25 @@ class DevicePingMonitorOptionsFlow(
         self.ping_requests_per_attempt = self.config_entry.options.get(CONF_PING_REQUESTS_PER_ATTEMPT, DEFAULT_PING_REQUESTS_PER_ATTEMPT)
         self.ping_interval = self.config_entry.options.get(CONF_PING_INTERVAL, DEFAULT_PING_INTERVAL)
         self.ping_method = self.config_entry.options.get(CONF_PING_METHOD, DEFAULT_PING_METHOD)
+        self.probe_priority = self.config_entry.options.get(CONF_PROBE_PRIORITY, DEFAULT_PROBE_PRIORITY)
+        self.suspicion_retry_interval = self.config_entry.options.get(CONF_SUSPICION_RETRY_INTERVAL, DEFAULT_SUSPICION_RETRY_INTERVAL)
+        self.offline_backoff_max_interval = self.config_entry.options.get(CONF_OFFLINE_BACKOFF_MAX_INTERVAL, DEFAULT_OFFLINE_BACKOFF_MAX_INTERVAL)
+        self.offline_backoff_fast_path = self.config_entry.options.get(CONF_OFFLINE_BACKOFF_FAST_PATH, DEFAULT_OFFLINE_BACKOFF_FAST_PATH)
+        self.ping_escalate_requests = self.config_entry.options.get(CONF_PING_ESCALATE_REQUESTS, DEFAULT_PING_ESCALATE_REQUESTS)
+        self.skip_reachable_neighbors = self.config_entry.options.get(CONF_SKIP_REACHABLE_NEIGHBORS, DEFAULT_SKIP_REACHABLE_NEIGHBORS)
+        self.passive_liveness = self.config_entry.options.get(CONF_PASSIVE_LIVENESS, DEFAULT_PASSIVE_LIVENESS)
+        self.tcp_port = self.config_entry.options.get(CONF_TCP_PORT, DEFAULT_TCP_PORT)
+        self.restore_state_on_startup = self.config_entry.options.get(CONF_RESTORE_STATE_ON_STARTUP, DEFAULT_RESTORE_STATE_ON_STARTUP)
         self.sensors_integration_summary_enabled = self.config_entry.options.get(CONF_SENSORS_INTEGRATION_SUMMARY_ENABLED, DEFAULT_SENSORS_INTEGRATION_SUMMARY_ENABLED)
         self.sensors_failed_pings_enabled = self.config_entry.options.get(CONF_SENSORS_FAILED_PINGS_ENABLED, DEFAULT_SENSORS_FAILED_PINGS_ENABLED)
         self.sensors_disconnected_since_enabled = self.config_entry.options.get(CONF_SENSORS_DISCONNECTED_SINCE_ENABLED, DEFAULT_SENSORS_DISCONNECTED_SINCE_ENABLED)
         self.sensors_last_response_time_enabled = self.config_entry.options.get(CONF_SENSORS_LAST_RESPONSE_TIME_ENABLED, DEFAULT_SENSORS_LAST_RESPONSE_TIME_ENABLED)
 
         if self.entry_type == ENTRY_TYPE_INTEGRATION:
-            zc = await zeroconf.async_get_instance(self.hass)
-            self.available_integrations = await get_valid_integrations_for_monitoring(self.hass, zc)
-            _LOGGER.info("Step Init: Found %d valid integrations for monitoring: %s",
-            len(self.available_integrations),
-                [integration.friendly_name for integration in self.available_integrations.values()]
+            # Only the monitored integration is needed, don't scan the others
+            self.integration_selected = await async_get_integration_catalog(self.hass).async_get_integration(
+                self.config_entry.data.get(CONF_INTEGRATION)
             )
-            self.integration_selected = self.available_integrations.get(self.config_entry.data.get(CONF_INTEGRATION))
             self.integration_device_selection_mode = self.config_entry.options.get(CONF_DEVICE_SELECTION_MODE, DEVICE_SELECTION_ALL)
             self.integration_selected_devices = copy.deepcopy(self.config_entry.options.get(CONF_SELECTED_DEVICES, []))
 
@@ -834,10 +1010,53 @@ class DevicePingMonitorOptionsFlow(
             return await self.async_step_custom_group_edit_action(user_input)
 
         elif self.entry_type == ENTRY_TYPE_NETWORK_SUMMARY:
-            return self.async_abort(reason="no_options_flow_available")
+            return await self.async_step_network_summary_budget(user_input)
         else:
             return self.async_abort(reason="unknown_config_entry_type")
 
+    async def async_step_network_summary_budget(self, user_input: dict[str, Any] | None = None):
+        """Handle the global probe budget step."""
+        if user_input is not None:
+            return self.async_create_entry(
+                data={
+                    CONF_MAX_PROBES_IN_FLIGHT: int(user_input[CONF_MAX_PROBES_IN_FLIGHT]),
+                    CONF_MAX_PACKETS_PER_SECOND: int(user_input[CONF_MAX_PACKETS_PER_SECOND]),
+                },
+            )
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MAX_PROBES_IN_FLIGHT,
+                    default=self.config_entry.options.get(CONF_MAX_PROBES_IN_FLIGHT, DEFAULT_MAX_PROBES_IN_FLIGHT),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=1000,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Required(
+                    CONF_MAX_PACKETS_PER_SECOND,
+                    default=self.config_entry.options.get(CONF_MAX_PACKETS_PER_SECOND, DEFAULT_MAX_PACKETS_PER_SECOND),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=10000,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="network_summary_budget",
+            data_schema=data_schema,
+            last_step=True,
+        )
+
     async def async_step_custom_group_edit_action(self, user_input: dict[str, Any] | None = None):
         """Handle custom group edit action."""
         if user_input is not None:
@@ -1007,6 +1226,15 @@ class DevicePingMonitorOptionsFlow(
                 CONF_PING_REQUESTS_PER_ATTEMPT: self.ping_requests_per_attempt,
                 CONF_PING_INTERVAL: self.ping_interval,
                 CONF_PING_METHOD: self.ping_method,
+                CONF_PROBE_PRIORITY: self.probe_priority,
+                CONF_SUSPICION_RETRY_INTERVAL: self.suspicion_retry_interval,
+                CONF_OFFLINE_BACKOFF_MAX_INTERVAL: self.offline_backoff_max_interval,
+                CONF_OFFLINE_BACKOFF_FAST_PATH: self.offline_backoff_fast_path,
+                CONF_PING_ESCALATE_REQUESTS: self.ping_escalate_requests,
+                CONF_SKIP_REACHABLE_NEIGHBORS: self.skip_reachable_neighbors,
+                CONF_PASSIVE_LIVENESS: self.passive_liveness,
+                CONF_TCP_PORT: self.tcp_port,
+                CONF_RESTORE_STATE_ON_STARTUP: self.restore_state_on_startup,
                 CONF_SENSORS_INTEGRATION_SUMMARY_ENABLED: self.sensors_integration_summary_enabled,
                 CONF_SENSORS_FAILED_PINGS_ENABLED: self.sensors_failed_pings_enabled,
                 CONF_SENSORS_DISCONNECTED_SINCE_ENABLED: self.sensors_disconnected_since_enabled,
@@ -1025,6 +1253,15 @@ class DevicePingMonitorOptionsFlow(
                 CONF_PING_REQUESTS_PER_ATTEMPT: self.ping_requests_per_attempt,
                 CONF_PING_INTERVAL: self.ping_interval,
                 CONF_PING_METHOD: self.ping_method,
+                CONF_PROBE_PRIORITY: self.probe_priority,
+                CONF_SUSPICION_RETRY_INTERVAL: self.suspicion_retry_interval,
+                CONF_OFFLINE_BACKOFF_MAX_INTERVAL: self.offline_backoff_max_interval,
+                CONF_OFFLINE_BACKOFF_FAST_PATH: self.offline_backoff_fast_path,
+                CONF_PING_ESCALATE_REQUESTS: self.ping_escalate_requests,
+                CONF_SKIP_REACHABLE_NEIGHBORS: self.skip_reachable_neighbors,
+                CONF_PASSIVE_LIVENESS: self.passive_liveness,
+                CONF_TCP_PORT: self.tcp_port,
+                CONF_RESTORE_STATE_ON_STARTUP: self.restore_state_on_startup,
                 CONF_SENSORS_INTEGRATION_SUMMARY_ENABLED: self.sensors_integration_summary_enabled,
                 CONF_SENSORS_FAILED_PINGS_ENABLED: self.sensors_failed_pings_enabled,
                 CONF_SENSORS_DISCONNECTED_SINCE_ENABLED: self.sensors_disconnected_since_enabled,
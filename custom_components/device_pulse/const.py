@@ -11,8 +11,49 @@ ENTRY_TYPE_CUSTOM_GROUP = "custom_group"
 
 PING_METHOD_ICMP = "icmp"
 PING_METHOD_ARP = "arp"
+PING_METHOD_ARP_SWEEP = "arp_sweep"
+PING_METHOD_TCP = "tcp"
+PING_METHOD_HTTP = "http"
 
 ARP_TIMEOUT = 1
+ICMP_TIMEOUT = 1
+TCP_TIMEOUT = 1
+HTTP_TIMEOUT = 3
+HTTP_KEEPALIVE_TIMEOUT = 660 # Seconds, longer than the longest ping interval
+HTTP_MAX_BODY_READ = 4096 # Bytes read from a response body, larger bodies close the connection
+
+TCP_MAX_CONCURRENT_CONNECTS = 100
+# Ports tried concurrently when the TCP port of a device is detected automatically
+TCP_AUTO_PORTS = [80, 443, 22, 8080, 8443, 8123, 1883, 554, 23, 53, 6668, 8008, 8009, 9100]
+TCP_DETECT_BACKOFF_MAX = 8 # Max updates between port detections of an offline device
+
+SCHEDULER_SLOT_DURATION = 1
+
+OFFLINE_BACKOFF_FACTOR = 2
+
+STATE_STORE_VERSION = 1
+STATE_STORE_SAVE_DELAY = 60
+STATE_STORE_MAX_AGE = 86400 # Saved states older than a day are not restored
+STATE_HANDOFF_MAX_AGE = 60
+
+DNS_CACHE_TTL = 300
+DNS_NEGATIVE_CACHE_TTL = 30
+ZEROCONF_LOOKUP_TIMEOUT = 1500 # Milliseconds
+
+HOST_CACHE_STORE_VERSION = 1
+HOST_CACHE_SAVE_DELAY = 10
+
+SETUP_MAX_CONCURRENCY = 16
+SETUP_RAMP_UP_DELAY = 0.1
+
+PROBE_PRIORITY_CRITICAL = "critical"
+PROBE_PRIORITY_NORMAL = "normal"
+PROBE_PRIORITY_BEST_EFFORT = "best_effort"
+PROBE_PRIORITY_RANKS = {
+    PROBE_PRIORITY_CRITICAL: 0,
+    PROBE_PRIORITY_NORMAL: 1,
+    PROBE_PRIORITY_BEST_EFFORT: 2,
+}
 
 CONF_ENTRY_TYPE = "entry_type"
 # Entry Type Integration specific fields and defaults
@@ -27,6 +68,15 @@ CONF_SENSORS_FAILED_PINGS_ENABLED = "sensors_failed_pings_enabled"
 CONF_SENSORS_DISCONNECTED_SINCE_ENABLED = "sensors_disconnected_since_enabled"
 CONF_SENSORS_LAST_RESPONSE_TIME_ENABLED = "sensors_last_response_time_enabled"
 CONF_PING_METHOD = "ping_method"
+CONF_PROBE_PRIORITY = "probe_priority"
+CONF_SUSPICION_RETRY_INTERVAL = "suspicion_retry_interval"
+CONF_OFFLINE_BACKOFF_MAX_INTERVAL = "offline_backoff_max_interval"
+CONF_OFFLINE_BACKOFF_FAST_PATH = "offline_backoff_fast_path"
+CONF_PING_ESCALATE_REQUESTS = "ping_escalate_requests"
+CONF_SKIP_REACHABLE_NEIGHBORS = "skip_reachable_neighbors"
+CONF_PASSIVE_LIVENESS = "passive_liveness"
+CONF_TCP_PORT = "tcp_port"
+CONF_RESTORE_STATE_ON_STARTUP = "restore_state_on_startup"
 
 DEFAULT_PING_ATTEMPTS_BEFORE_FAILURE = 3
 DEFAULT_PING_REQUESTS_PER_ATTEMPT = 1
@@ -36,6 +86,15 @@ DEFAULT_SENSORS_FAILED_PINGS_ENABLED = False
 DEFAULT_SENSORS_DISCONNECTED_SINCE_ENABLED = False
 DEFAULT_SENSORS_LAST_RESPONSE_TIME_ENABLED = False
 DEFAULT_PING_METHOD = PING_METHOD_ICMP
+DEFAULT_PROBE_PRIORITY = PROBE_PRIORITY_NORMAL
+DEFAULT_SUSPICION_RETRY_INTERVAL = 0
+DEFAULT_OFFLINE_BACKOFF_MAX_INTERVAL = 0
+DEFAULT_OFFLINE_BACKOFF_FAST_PATH = True
+DEFAULT_PING_ESCALATE_REQUESTS = False
+DEFAULT_SKIP_REACHABLE_NEIGHBORS = False
+DEFAULT_PASSIVE_LIVENESS = False
+DEFAULT_TCP_PORT = 0
+DEFAULT_RESTORE_STATE_ON_STARTUP = True
 
 DEVICE_SELECTION_ALL = "all"
 DEVICE_SELECTION_EXCLUDE = "exclude"
@@ -56,6 +115,12 @@ CONF_GROUP_DEVICE_HOST = "group_device_host"
 
 NETWORK_SUMMARY_ENTRY_ID = "network_summary"
 
+# Entry Type Network Summary specific fields and defaults, global probe budget
+CONF_MAX_PROBES_IN_FLIGHT = "max_probes_in_flight"
+CONF_MAX_PACKETS_PER_SECOND = "max_packets_per_second"
+DEFAULT_MAX_PROBES_IN_FLIGHT = 64
+DEFAULT_MAX_PACKETS_PER_SECOND = 200
+
 NETWORK_SUMMARY_ALL_DEVICES_ONLINE_STATUS_ID = f"{DOMAIN}_network_summary_all_devices_online_status"
 NETWORK_SUMMARY_TOTAL_DEVICES_COUNT = f"{DOMAIN}_network_summary_total_devices_count"
 NETWORK_SUMMARY_TOTAL_DEVICES_OFFLINE_COUNT = f"{DOMAIN}_network_summary_total_devices_offline_count"
@@ -67,6 +132,7 @@ ENTITY_ATTR_INTEGRATION_NAME = "integration_name"
 ENTITY_ATTR_INTEGRATION_CUSTOM_GROUP = "integration_custom_group"
 ENTITY_ATTR_DEVICE_ID = "device_id"
 ENTITY_ATTR_HOST = "host"
+ENTITY_ATTR_IP_ADDRESS = "ip_address"
 ENTITY_ATTR_HOST_SOURCE = "host_source"
 ENTITY_ATTR_TAG = "tag"
 ENTITY_ATTR_STATE_SINCE = "state_since"
@@ -80,4 +146,7 @@ ENTITY_TAG_LAST_RESPONSE_TIME = "last_response_time"
 
 EVENT_PING_STATUS_UPDATED = f"{DOMAIN}_ping_status_updated"
 EVENT_DEVICE_WENT_OFFLINE = f"{DOMAIN}_device_went_offline"
-EVENT_DEVICE_CAME_ONLINE = f"{DOMAIN}_device_came_online"
\ No newline at end of file
+EVENT_DEVICE_CAME_ONLINE = f"{DOMAIN}_device_came_online"
+
+# Dispatcher signal of a monitor added to a loaded config entry, formatted with the entry id
+SIGNAL_MONITOR_ADDED = f"{DOMAIN}_monitor_added_{{}}"
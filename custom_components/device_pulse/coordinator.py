@@ -1,14 +1,13 @@
 """Coordinator to manage ping updates for devices."""
 
-from dataclasses import dataclass
-from datetime import timedelta
+from dataclasses import dataclass, field
+from datetime import datetime
 import logging
-import random
 from typing import Any
 
 from homeassistant.components.ping import PingDataICMPLib, PingDataSubProcess
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
@@ -17,13 +16,26 @@ from .const import (
     DEFAULT_PING_ATTEMPTS_BEFORE_FAILURE,
     DEFAULT_PING_REQUESTS_PER_ATTEMPT,
     DEFAULT_PING_INTERVAL,
+    DEFAULT_PROBE_PRIORITY,
+    DEFAULT_SUSPICION_RETRY_INTERVAL,
+    DEFAULT_OFFLINE_BACKOFF_MAX_INTERVAL,
     EVENT_DEVICE_CAME_ONLINE,
     EVENT_DEVICE_WENT_OFFLINE,
+    OFFLINE_BACKOFF_FACTOR,
     PING_METHOD_ARP,
-    PING_METHOD_ICMP
+    PING_METHOD_ARP_SWEEP,
+    PING_METHOD_HTTP,
+    PING_METHOD_ICMP,
+    PING_METHOD_TCP,
 )
-from .arping import PingDataARP
-from .utils import IntegrationData, format_duration
+from .activity import DeviceActivityTracker
+from .arping import PingDataARP, PingDataARPSweep
+from .httping import PingDataHTTP
+from .icmp import PingDataEscalating, PingDataICMPEngine
+from .neighbors import NeighborMonitor
+from .tcping import PingDataTCP
+from .scheduler import ProbeScheduler
+from .utils import IntegrationData, format_duration, is_valid_ip, resolve_hostname_to_ip
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +49,18 @@ class PingResult:
     data: dict[str, Any]
 
 
+@dataclass(slots=True)
+class CoordinatorState:
+    """Last known state of a device monitor."""
+
+    is_alive: bool
+    failed_pings: int = 0
+    failed_started_at: datetime | None = None
+    last_response_time: float | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    backoff_slots: int = 1
+
+
 class DevicePingCoordinator(DataUpdateCoordinator[PingResult]):
     """Coordinator to manage ping updates."""
 
@@ -47,23 +71,40 @@ class DevicePingCoordinator(DataUpdateCoordinator[PingResult]):
         integration: IntegrationData,
         device_entry: DeviceEntry,
         host_source: str,
-        ping: PingDataICMPLib | PingDataSubProcess | PingDataARP,
+        ping: PingDataICMPLib | PingDataSubProcess | PingDataICMPEngine | PingDataEscalating | PingDataARP | PingDataTCP | PingDataHTTP,
         ping_attempts_before_failure: int = DEFAULT_PING_ATTEMPTS_BEFORE_FAILURE,
         ping_requests_per_attempt: int = DEFAULT_PING_REQUESTS_PER_ATTEMPT,
         ping_interval: int = DEFAULT_PING_INTERVAL,
+        scheduler: ProbeScheduler | None = None,
+        probe_priority: str = DEFAULT_PROBE_PRIORITY,
+        suspicion_retry_interval: int = DEFAULT_SUSPICION_RETRY_INTERVAL,
+        offline_backoff_max_interval: int = DEFAULT_OFFLINE_BACKOFF_MAX_INTERVAL,
+        neighbors: NeighborMonitor | None = None,
+        activity: DeviceActivityTracker | None = None,
+        host: str | None = None,
     ) -> None:
         """Initialize the coordinator."""
         self.integration: IntegrationData = integration
         self.device_entry: DeviceEntry = device_entry
         self.host_source: str = host_source
+        self.host = host
         self.ping = ping
-        self.ping_interval = ping_interval * 1000  # Convert to milliseconds
         self.ping_attempts_before_failure = ping_attempts_before_failure
         self.ping_requests_per_attempt = ping_requests_per_attempt
         self.failed_pings = 0
         self.failed_started_at = None
         self.last_response_time = None
+        self.scheduler = scheduler
+        self.probe_priority = probe_priority
+        self.neighbors = neighbors
+        self.activity = activity
+        self._suspicion_retry_interval = suspicion_retry_interval
+        self._offline_backoff_max_interval = offline_backoff_max_interval
+        self._backoff_slots = 1
+        self._skipped_slots = 0
+        self._set_ping_interval(ping_interval)
         self._first_update = True
+        self._unsub_suspicion: CALLBACK_TYPE | None = None
 
         # Remove unnecessary logs from inner coordinator methods
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -77,19 +118,212 @@ class DevicePingCoordinator(DataUpdateCoordinator[PingResult]):
             inner_logger,
             config_entry=config_entry,
             name=f"Ping {ping.ip_address}",
-            update_interval=self._calculate_update_interval(),
+            # Refreshes are dispatched by the central probe scheduler
+            update_interval=None,
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending confirmation probe and shutdown the coordinator."""
+        self._cancel_suspicion()
+        await super().async_shutdown()
+
+    @property
+    def probe_packets(self) -> int:
+        """Return the packets sent by the next probe, accounted by the probe budget."""
+        if isinstance(self.ping, PingDataTCP):
+            return self.ping.packets
+        return self.ping_requests_per_attempt
+
+    @property
+    def can_update_requests_per_attempt(self) -> bool:
+        """Return True if the requests per attempt can be changed on the running ping handler."""
+        return not isinstance(self.ping, (PingDataICMPLib, PingDataSubProcess, PingDataEscalating))
+
+    def update_options(
+        self, ping_attempts_before_failure: int, ping_requests_per_attempt: int, ping_interval: int
+    ) -> None:
+        """Apply new options to the running monitor, keeping its state."""
+        self.ping_attempts_before_failure = ping_attempts_before_failure
+        if self.can_update_requests_per_attempt:
+            self.ping_requests_per_attempt = ping_requests_per_attempt
+            self.ping.count = ping_requests_per_attempt
+        self._set_ping_interval(ping_interval)
+
+    def _set_ping_interval(self, ping_interval: int) -> None:
+        """Set the ping interval (s) and the timings depending on it."""
+        self.ping_interval = ping_interval * 1000  # Convert to milliseconds
+        # Confirmation probes are only useful when faster than the regular ones
+        self.suspicion_retry_interval = (
+            self._suspicion_retry_interval if 0 < self._suspicion_retry_interval < ping_interval else 0
+        )
+        # Offline devices are probed every _backoff_slots regular slots, up to the max interval
+        self.offline_backoff_max_slots = max(1, self._offline_backoff_max_interval // ping_interval)
+        self._backoff_slots = min(self._backoff_slots, self.offline_backoff_max_slots)
+
+    @property
+    def can_retarget(self) -> bool:
+        """Return True if the target address of the running ping handler can be changed.
+
+        ARP handlers are bound to the interface, and sweep, chosen for the
+        address at setup, a new address may not be on the same local subnet.
+        """
+        return not isinstance(self.ping, (PingDataSubProcess, PingDataEscalating, PingDataHTTP, PingDataARP))
+
+    async def _async_follow_host(self) -> None:
+        """Switch the probes to the current address of a hostname based host."""
+        if not self.host or is_valid_ip(self.host) or not self.can_retarget:
+            return
+
+        if not (ip_address := await resolve_hostname_to_ip(self.hass, self.host)) or ip_address == self.ping.ip_address:
+            return
+
+        if is_valid_ip(self.ping.ip_address):
+            _LOGGER.info(
+                "[%s] Device [%s] host [%s] moved from [%s] to [%s]",
+                self.integration.friendly_name,
+                self.device_entry.name,
+                self.host,
+                self.ping.ip_address,
+                ip_address,
+            )
+        self.ping.ip_address = ip_address
+
+    def export_state(self) -> CoordinatorState:
+        """Return the current state, to be restored later."""
+        return CoordinatorState(
+            self.data.is_alive,
+            self.failed_pings,
+            self.failed_started_at,
+            self.last_response_time,
+            dict(self.data.data),
+            self._backoff_slots,
+        )
+
+    def restore_state(self, state: CoordinatorState) -> None:
+        """Start from the last known state instead of probing the device."""
+        self.failed_pings = state.failed_pings
+        # An offline device without a known outage start is offline at least since now
+        self.failed_started_at = state.failed_started_at or (None if state.is_alive else dt_util.now())
+        self.last_response_time = state.last_response_time
+        self.data = PingResult(
+            is_alive=state.is_alive,
+            ip_address=self.ping.ip_address,
+            data=state.data or ({"avg": state.last_response_time} if state.last_response_time is not None else {}),
+        )
+        self._backoff_slots = min(state.backoff_slots, self.offline_backoff_max_slots)
+        self._skipped_slots = 0
+        # Failures after a restore follow the attempts threshold
+        self._first_update = False
+
+    def is_probe_due(self) -> bool:
+        """Return True if the regular probe must run, skipping slots while backed off."""
+        if self._skipped_slots + 1 >= self._backoff_slots:
+            self._skipped_slots = 0
+            return True
+
+        self._skipped_slots += 1
+
+        return False
+
+    def is_passively_alive(self) -> bool:
+        """Return True if the device proved to be alive within the last interval without probing it.
+
+        The device is alive when the kernel confirmed it reachable, or when one
+        of its entities from the monitored integration pushed an update.
+        """
+        max_age = self.ping_interval / 1000
+
+        return (
+            self.neighbors is not None and self.neighbors.is_reachable(self.ping.ip_address, max_age)
+        ) or (
+            self.activity is not None and self.activity.is_active(self.device_entry.id, max_age)
+        )
+
+    @callback
+    def async_wake(self) -> None:
+        """Leave the offline backoff and probe the device as soon as possible."""
+        if self._backoff_slots == 1 or not self.scheduler:
+            return
+
+        _LOGGER.debug(
+            "[%s] Device [%s][%s] shows activity, leaving offline backoff",
+            self.integration.friendly_name,
+            self.device_entry.name,
+            self.ping.ip_address,
+        )
+        self._backoff_slots = 1
+        self._skipped_slots = 0
+        self.scheduler.async_probe_later(
+            self.device_entry.id,
+            0,
+            self.async_refresh,
+            self.probe_priority,
+            self.probe_packets,
+        )
+
+    def _update_backoff(self, is_alive: bool) -> None:
+        """Grow the probing interval of offline devices, reset it once online."""
+        if is_alive:
+            self._backoff_slots = 1
+            self._skipped_slots = 0
+        elif self._backoff_slots < self.offline_backoff_max_slots:
+            self._backoff_slots = min(self._backoff_slots * OFFLINE_BACKOFF_FACTOR, self.offline_backoff_max_slots)
+            _LOGGER.debug(
+                "[%s] Device [%s][%s] offline, probing every %ds",
+                self.integration.friendly_name,
+                self.device_entry.name,
+                self.ping.ip_address,
+                self._backoff_slots * self.ping_interval // 1000,
+            )
+
+    def _schedule_suspicion(self) -> None:
+        """Schedule a confirmation probe after a failure of an online device."""
+        if not self.suspicion_retry_interval or not self.scheduler:
+            return
+
+        self._cancel_suspicion()
+        self._unsub_suspicion = self.scheduler.async_probe_later(
+            self.device_entry.id,
+            self.suspicion_retry_interval,
+            self.async_refresh,
+            self.probe_priority,
+            self.probe_packets,
         )
 
+    def _cancel_suspicion(self) -> None:
+        """Cancel the pending confirmation probe, if any."""
+        if self._unsub_suspicion:
+            self._unsub_suspicion()
+            self._unsub_suspicion = None
+
     async def _async_update_data(self) -> PingResult:
         """Fetch data from ping."""
-        await self.ping.async_update()
+        # The pending confirmation probe, if any, is superseded by this one
+        self._cancel_suspicion()
+        await self._async_follow_host()
 
-        # Adjust the next update interval
-        self.update_interval = self._calculate_update_interval()
+        # Skip the probe when other traffic just confirmed the device is reachable
+        if probe_skipped := self.is_passively_alive():
+            ping_alive = True
+            # No new timing was measured, the previous one is kept as is
+            ping_data = self.data.data if self.data else None
+            _LOGGER.debug(
+                "[%s] Device [%s][%s] recently seen alive, probe skipped",
+                self.integration.friendly_name,
+                self.device_entry.name,
+                self.ping.ip_address,
+            )
+        else:
+            await self.ping.async_update()
+            ping_alive = self.ping.is_alive
+            ping_data = self.ping.data
+            # TCP port detections connect to all the well-known ports
+            if self.scheduler and isinstance(self.ping, PingDataTCP):
+                self.scheduler.async_set_packets(self.device_entry.id, self.ping.packets)
 
         is_alive = True
 
-        if self.ping.is_alive:
+        if ping_alive:
             if (
                 self.data
                 and not self.data.is_alive
@@ -112,16 +346,18 @@ class DevicePingCoordinator(DataUpdateCoordinator[PingResult]):
                 )
             self.failed_pings = 0
             self.failed_started_at = None
-            self.last_response_time = (
-                round(self.ping.data.get("avg"), 3) if self.ping.data else None
-            )
-            _LOGGER.debug(
-                "[%s] Device [%s][%s] ping successful, response time: %sms",
-                self.integration.friendly_name,
-                self.device_entry.name,
-                self.ping.ip_address,
-                self.last_response_time,
-            )
+            # A skipped probe measured nothing, don't report the last response time as a fresh one
+            if not probe_skipped:
+                self.last_response_time = (
+                    round(ping_data.get("avg"), 3) if ping_data else None
+                )
+                _LOGGER.debug(
+                    "[%s] Device [%s][%s] ping successful, response time: %sms",
+                    self.integration.friendly_name,
+                    self.device_entry.name,
+                    self.ping.ip_address,
+                    self.last_response_time,
+                )
         else:
             if not self.failed_pings:
                 self.failed_started_at = dt_util.now()
@@ -183,6 +419,8 @@ class DevicePingCoordinator(DataUpdateCoordinator[PingResult]):
                     self.failed_pings,
                     self.ping_attempts_before_failure,
                 )
+                # Confirm the failure without waiting for the next regular probe
+                self._schedule_suspicion()
 
             else:
                 is_alive = self.data.is_alive
@@ -190,23 +428,24 @@ class DevicePingCoordinator(DataUpdateCoordinator[PingResult]):
         if self._first_update:
             self._first_update = False
 
+        self._update_backoff(is_alive)
+
         return PingResult(
             is_alive=is_alive,
             ip_address=self.ping.ip_address,
-            data=self.ping.data or {},
+            data=ping_data or {},
         )
 
-    def _calculate_update_interval(self) -> timedelta:
-        """Calculate next update interval with jitter to distribute requests evenly."""
-        variation = self.ping_interval * 0.05  # 5% variation
-        jittered_interval = self.ping_interval + random.uniform(-variation, variation)
-
-        return timedelta(milliseconds=jittered_interval)
-
     @property
     def ping_method(self) -> str:
-        """Return the ping method being used (ICMP or ARP)."""
+        """Return the ping method being used (ICMP, ARP, ARP sweep, TCP or HTTP)."""
+        if isinstance(self.ping, PingDataARPSweep):
+            return PING_METHOD_ARP_SWEEP
         if isinstance(self.ping, PingDataARP):
             return PING_METHOD_ARP
+        if isinstance(self.ping, PingDataTCP):
+            return PING_METHOD_TCP
+        if isinstance(self.ping, PingDataHTTP):
+            return PING_METHOD_HTTP
         return PING_METHOD_ICMP
 
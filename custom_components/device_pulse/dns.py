@@ -0,0 +1,93 @@
+"""Shared DNS cache for Device Pulse."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import socket
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DNS_CACHE_TTL, DNS_NEGATIVE_CACHE_TTL, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_DNS_CACHE: HassKey[DnsCache] = HassKey(f"{DOMAIN}_dns_cache")
+
+
+@dataclass(slots=True)
+class _DnsEntry:
+    """A cached answer."""
+
+    address: str | None
+    expires_at: float
+
+
+class DnsCache:
+    """Resolve hostnames to IPv4 addresses, caching the answers.
+
+    The system resolver doesn't expose the TTL of the records, so answers are
+    kept for a fixed time, and failures for a shorter one, so an unknown name
+    is not looked up again on every probe. Concurrent lookups of the same name
+    share a single resolution.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._entries: dict[str, _DnsEntry] = {}
+        self._pending: dict[str, asyncio.Task[str | None]] = {}
+
+    async def async_resolve(self, hostname: str) -> str | None:
+        """Return the IPv4 address of hostname, None if it can't be resolved."""
+        key = hostname.lower()
+
+        if (entry := self._entries.get(key)) and entry.expires_at > time.monotonic():
+            return entry.address
+
+        if not (lookup := self._pending.get(key)):
+            lookup = self._pending[key] = self.hass.async_create_background_task(
+                self._async_lookup(key), f"{DOMAIN} resolve {hostname}"
+            )
+
+        # A cancelled caller doesn't cancel the lookup shared with the other ones
+        return await asyncio.shield(lookup)
+
+    async def _async_lookup(self, hostname: str) -> str | None:
+        """Resolve hostname and cache the answer."""
+        address: str | None = None
+        try:
+            infos = await self.hass.loop.getaddrinfo(
+                hostname, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+            )
+        except (socket.gaierror, UnicodeError) as err:
+            _LOGGER.debug("Failed to resolve hostname %s: %s", hostname, err)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Unexpected error resolving hostname %s: %s", hostname, err)
+        else:
+            address = infos[0][4][0] if infos else None
+        finally:
+            self._pending.pop(hostname, None)
+
+        previous = self._entries.get(hostname)
+        if previous and previous.address and address and previous.address != address:
+            _LOGGER.info("Hostname %s moved from %s to %s", hostname, previous.address, address)
+        else:
+            _LOGGER.debug("Resolved hostname %s to IP %s", hostname, address)
+
+        self._entries[hostname] = _DnsEntry(
+            address, time.monotonic() + (DNS_CACHE_TTL if address else DNS_NEGATIVE_CACHE_TTL)
+        )
+
+        return address
+
+
+@callback
+@singleton(DATA_DNS_CACHE)
+def async_get_dns_cache(hass: HomeAssistant) -> DnsCache:
+    """Return the DNS cache shared by all the probes."""
+    return DnsCache(hass)
@@ -5,7 +5,6 @@ import logging
 
 from custom_components.device_pulse.coordinator import DevicePingCoordinator
 from custom_components.device_pulse.const import (
-    DOMAIN,
     ENTITY_ATTR_INTEGRATION_DOMAIN,
     ENTITY_ATTR_INTEGRATION_NAME,
     ENTITY_ATTR_INTEGRATION_CUSTOM_GROUP,
@@ -13,8 +12,9 @@ from custom_components.device_pulse.const import (
     ENTITY_ATTR_TAG,
     ENTITY_ATTR_HOST,
     ENTITY_ATTR_HOST_SOURCE,
+    ENTITY_ATTR_IP_ADDRESS,
 )
-from custom_components.device_pulse.utils import IntegrationData
+from custom_components.device_pulse.utils import IntegrationData, build_entity_unique_id
 
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -31,6 +31,7 @@ class BaseCoordinatorEntity(CoordinatorEntity[DevicePingCoordinator], abc.ABC):
         ENTITY_ATTR_DEVICE_ID,
         ENTITY_ATTR_HOST,
         ENTITY_ATTR_HOST_SOURCE,
+        ENTITY_ATTR_IP_ADDRESS,
         ENTITY_ATTR_TAG
     })
 
@@ -46,8 +47,7 @@ class BaseCoordinatorEntity(CoordinatorEntity[DevicePingCoordinator], abc.ABC):
         self._integration: IntegrationData = integration
 
         # Build unique_id based on identifier
-        device_id = next(iter(device.identifiers), (None, device.id))[1]
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_{self._tag}"
+        self._attr_unique_id = build_entity_unique_id(device, self._tag)
         self._attr_name = f"{device.name_by_user or device.name} {self._name_suffix}"
 
         self._configure()
@@ -86,8 +86,10 @@ class BaseCoordinatorEntity(CoordinatorEntity[DevicePingCoordinator], abc.ABC):
             ENTITY_ATTR_INTEGRATION_NAME: self._integration.friendly_name,
             ENTITY_ATTR_INTEGRATION_CUSTOM_GROUP: self._integration.custom_group,
             ENTITY_ATTR_DEVICE_ID: self.device_entry.id,
-            ENTITY_ATTR_HOST: self.coordinator.ping.ip_address,
+            ENTITY_ATTR_HOST: self.coordinator.host or self.coordinator.ping.ip_address,
             ENTITY_ATTR_HOST_SOURCE: self.coordinator.host_source,
+            # Address currently probed, follows the hostname when its address changes
+            ENTITY_ATTR_IP_ADDRESS: self.coordinator.ping.ip_address,
             ENTITY_ATTR_TAG: self._tag,
         }
 
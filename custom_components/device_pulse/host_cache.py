@@ -0,0 +1,176 @@
+"""Persisted cache of the device hosts for Device Pulse."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from zeroconf import RecordUpdate, RecordUpdateListener, Zeroconf
+
+from homeassistant.components import zeroconf
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, HOST_CACHE_SAVE_DELAY, HOST_CACHE_STORE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HOST_CACHE: HassKey[HostCache] = HassKey(f"{DOMAIN}_host_cache")
+
+HOST_CACHE_STORE_KEY = f"{DOMAIN}.hosts"
+
+
+class _ZeroconfAnnouncements(RecordUpdateListener):
+    """Forward the zeroconf record updates to the host cache."""
+
+    def __init__(self, host_cache: HostCache) -> None:
+        """Initialize the listener."""
+        self._host_cache = host_cache
+
+    def async_update_records(self, zc: Zeroconf, now: float, records: list[RecordUpdate]) -> None:
+        """Invalidate the hosts of the announced services."""
+        self._host_cache.async_invalidate_zeroconf({record.new.name.lower() for record in records})
+
+
+class HostCache:
+    """Remember the host extracted for each device across restarts.
+
+    A cached host stays valid as long as the device and its primary config
+    entry are not modified, so warm starts skip the host resolvers, the config
+    entry scans and the zeroconf queries. Hosts found through zeroconf are
+    also dropped when their service announces itself again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, HOST_CACHE_STORE_VERSION, HOST_CACHE_STORE_KEY)
+        self._hosts: dict[str, dict[str, Any]] = {}
+        self._zeroconf_devices: dict[str, set[str]] = {}
+        self._zeroconf_listener: _ZeroconfAnnouncements | None = None
+
+    async def async_load(self) -> None:
+        """Load the saved hosts, dropping the ones of removed devices."""
+        device_registry = dr.async_get(self.hass)
+        hosts = await self._store.async_load() or {}
+        self._hosts = {
+            device_id: host
+            for device_id, host in hosts.items()
+            # Failed zeroconf lookups were saved by previous versions, look them up again
+            if device_registry.async_get(device_id) and (host["host"] or not host.get("zeroconf_name"))
+        }
+
+        for device_id, host in self._hosts.items():
+            if zeroconf_name := host.get("zeroconf_name"):
+                self._zeroconf_devices.setdefault(zeroconf_name, set()).add(device_id)
+
+        # Hosts served from the cache on warm starts must still follow the announcements
+        if self._zeroconf_devices:
+            self._async_listen_zeroconf(await zeroconf.async_get_instance(self.hass))
+
+        self.hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated)
+        _LOGGER.debug("Loaded the cached host of %d devices", len(self._hosts))
+
+    @callback
+    def async_get(self, device: dr.DeviceEntry, config_entry: ConfigEntry) -> tuple[str | None, str | None] | None:
+        """Return the cached host and source of a device, None when missing or outdated."""
+        if not (host := self._hosts.get(device.id)):
+            return None
+
+        if (
+            host["config_entry_id"] != config_entry.entry_id
+            or host["config_entry_modified_at"] != config_entry.modified_at.timestamp()
+            or host["device_modified_at"] != device.modified_at.timestamp()
+        ):
+            self._async_remove(device.id)
+            return None
+
+        return host["host"], host["source"]
+
+    @callback
+    def async_set(
+        self,
+        device: dr.DeviceEntry,
+        config_entry: ConfigEntry,
+        host: str | None,
+        source: str | None,
+        zc: zeroconf.models.HaZeroconf | None = None,
+        zeroconf_name: str | None = None,
+    ) -> None:
+        """Cache the host and source of a device, watching the announcements of its zeroconf service."""
+        self._async_remove(device.id)
+        self._hosts[device.id] = {
+            "host": host,
+            "source": source,
+            "config_entry_id": config_entry.entry_id,
+            "config_entry_modified_at": config_entry.modified_at.timestamp(),
+            "device_modified_at": device.modified_at.timestamp(),
+            "zeroconf_name": zeroconf_name.lower() if zeroconf_name else None,
+        }
+
+        if zeroconf_name:
+            self._zeroconf_devices.setdefault(zeroconf_name.lower(), set()).add(device.id)
+            if zc is not None and self._zeroconf_listener is None:
+                self._async_listen_zeroconf(zc)
+
+        self._store.async_delay_save(self._data_to_save, HOST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _async_listen_zeroconf(self, zc: zeroconf.models.HaZeroconf) -> None:
+        """Watch the zeroconf announcements until Home Assistant stops."""
+        listener = self._zeroconf_listener = _ZeroconfAnnouncements(self)
+        zc.async_add_listener(listener, None)
+
+        @callback
+        def _async_stop_listening(_: Event) -> None:
+            zc.async_remove_listener(listener)
+            self._zeroconf_listener = None
+
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_listening)
+
+    @callback
+    def async_invalidate_zeroconf(self, names: set[str]) -> None:
+        """Drop the hosts of the devices of the announced zeroconf services."""
+        if not (device_ids := set().union(*(self._zeroconf_devices.get(name, ()) for name in names))):
+            return
+
+        _LOGGER.debug("Zeroconf announcement received, dropping the cached host of %d devices", len(device_ids))
+        for device_id in device_ids:
+            self._async_remove(device_id)
+
+    @callback
+    def _async_device_registry_updated(self, event: Event[dr.EventDeviceRegistryUpdatedData]) -> None:
+        """Drop the host of an updated or removed device."""
+        if event.data["action"] in ("update", "remove"):
+            self._async_remove(event.data["device_id"])
+
+    @callback
+    def _async_remove(self, device_id: str) -> None:
+        """Drop the host of a device."""
+        if not (host := self._hosts.pop(device_id, None)):
+            return
+
+        if (zeroconf_name := host.get("zeroconf_name")) and (devices := self._zeroconf_devices.get(zeroconf_name)):
+            devices.discard(device_id)
+            if not devices:
+                del self._zeroconf_devices[zeroconf_name]
+
+        self._store.async_delay_save(self._data_to_save, HOST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the hosts to save."""
+        return self._hosts
+
+
+@singleton(DATA_HOST_CACHE)
+async def async_get_host_cache(hass: HomeAssistant) -> HostCache:
+    """Return the host cache shared by the setup and the config flows."""
+    host_cache = HostCache(hass)
+    await host_cache.async_load()
+    return host_cache
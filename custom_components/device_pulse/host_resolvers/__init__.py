@@ -1,49 +1,51 @@
 import asyncio
 import importlib
-import pkgutil
 from .base import BaseHostResolver
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import device_registry as dr
 
-_resolvers_cache: dict[str, type[BaseHostResolver]] | None = None
+# Integration domain -> module of its resolver, in this package
+RESOLVER_MODULES: dict[str, str] = {
+    "jellyfin": "jellyfin",
+    "localtuya": "localtuya",
+    "midea_dehumidifier_lan": "midea_dehumidifier_lan",
+    "opensprinkler": "opensprinkler",
+    "pi_hole": "pi_hole",
+    "qbittorrent": "qbittorrent",
+    "tasmota": "tasmota",
+}
 
+_resolvers_cache: dict[str, type[BaseHostResolver] | None] = {}
 
-async def discover_resolvers() -> dict[str, type[BaseHostResolver]]:
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, _discover_resolvers)
 
+async def get_resolver(domain: str) -> type[BaseHostResolver] | None:
+    """Return the resolver of an integration, importing only its module on first use."""
+    if domain not in RESOLVER_MODULES:
+        return None
 
-def _discover_resolvers() -> dict[str, type[BaseHostResolver]]:
-    global _resolvers_cache
-    if _resolvers_cache is not None:
-        return _resolvers_cache
+    if domain not in _resolvers_cache:
+        loop = asyncio.get_running_loop()
+        _resolvers_cache[domain] = await loop.run_in_executor(None, _load_resolver, RESOLVER_MODULES[domain])
 
-    resolvers = {}
-    package_path = __path__
-    package_name = __name__
+    return _resolvers_cache[domain]
 
-    for _, module_name, _ in pkgutil.iter_modules(package_path):
-        module = importlib.import_module(f"{package_name}.{module_name}")
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            if (
-                isinstance(attr, type)
-                and issubclass(attr, BaseHostResolver)
-                and attr is not BaseHostResolver
-            ):
-                resolvers[module_name] = attr
 
-    _resolvers_cache = resolvers
+def _load_resolver(module_name: str) -> type[BaseHostResolver] | None:
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    for attr in vars(module).values():
+        if (
+            isinstance(attr, type)
+            and issubclass(attr, BaseHostResolver)
+            and attr is not BaseHostResolver
+        ):
+            return attr
 
-    return resolvers
+    return None
 
 
 async def resolve(config_entry: ConfigEntry, device: dr.DeviceEntry) -> str | None:
-    resolvers = await discover_resolvers()
-    domain = config_entry.domain
-
-    if not (resolver := resolvers.get(domain)):
+    if not (resolver := await get_resolver(config_entry.domain)):
         return None
 
     return resolver.resolve(config_entry, device)
@@ -0,0 +1,133 @@
+"""HTTP(S) probing for Device Pulse."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, HTTP_KEEPALIVE_TIMEOUT, HTTP_MAX_BODY_READ, HTTP_TIMEOUT
+from .utils import build_ping_data, is_valid_ip, resolve_hostname_to_ip
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HTTP_SESSION: HassKey[aiohttp.ClientSession] = HassKey(f"{DOMAIN}_http_session")
+
+HTTP_METHOD_NOT_ALLOWED = (405, 501)
+
+
+async def async_get_device_probe_url(hass: HomeAssistant, device: dr.DeviceEntry, host: str) -> str:
+    """Return the URL to probe for a device, its configuration URL when it is a web page served by the device.
+
+    A configuration URL pointing to another server, e.g. a cloud portal,
+    would report the device alive whenever that server answers.
+    """
+    if device.configuration_url and await _async_is_device_url(hass, device.configuration_url, host):
+        return device.configuration_url
+
+    return f"http://{host}/"
+
+
+async def _async_is_device_url(hass: HomeAssistant, url: str, host: str) -> bool:
+    """Return True if url is a web page served by host."""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not (url_host := parsed.hostname):
+        return False
+
+    if url_host == host.lower():
+        return True
+
+    # The URL and the device may name the same address differently, e.g. a hostname and its IP
+    url_ip = url_host if is_valid_ip(url_host) else await resolve_hostname_to_ip(hass, url_host)
+    host_ip = host if is_valid_ip(host) else await resolve_hostname_to_ip(hass, host)
+
+    return url_ip is not None and url_ip == host_ip
+
+
+class PingDataHTTP:
+    """Handle HTTP(S) probes through the client session shared by the HTTP probes.
+
+    Connections are kept alive longer than the longest ping interval, so
+    steady state probes reuse them instead of paying a new TCP and TLS
+    handshake on every interval, unless the device closes them first. Any
+    HTTP response, whatever its status, proves the device is alive.
+    """
+
+    def __init__(self, hass: HomeAssistant, ip_address: str, count: int, url: str) -> None:
+        """Initialize the HTTP ping handler."""
+        self.hass = hass
+        self.ip_address = ip_address
+        self.count = count
+        self.url = url
+        self.is_alive = False
+        self.data: dict[str, Any] | None = None
+        self._session = async_get_probe_session(hass)
+        self._method = "HEAD"
+
+    async def async_update(self) -> None:
+        """Send HTTP requests to check if the host is alive."""
+        response_times = []
+
+        # Stop at the first request answered, like the ARP probes
+        for _ in range(self.count):
+            if (response_time := await self._async_request()) is not None:
+                response_times.append(response_time)
+                break
+
+        self.is_alive = bool(response_times)
+        self.data = build_ping_data(response_times) if self.is_alive else None
+
+    async def _async_request(self) -> float | None:
+        """Send a request and return the response time (ms), None on failure."""
+        started_at = time.perf_counter()
+        try:
+            async with self._session.request(
+                self._method,
+                self.url,
+                allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+            ) as response:
+                response_time = round((time.perf_counter() - started_at) * 1000, 3)
+                # Read a small body so the connection goes back to the pool,
+                # closing it instead of downloading a whole web page
+                size = 0
+                while size < HTTP_MAX_BODY_READ and (chunk := await response.content.read(HTTP_MAX_BODY_READ - size)):
+                    size += len(chunk)
+                if not response.content.at_eof():
+                    response.close()
+        except (TimeoutError, aiohttp.ClientError) as err:
+            _LOGGER.debug("HTTP %s request to %s failed: %s", self._method, self.url, err or "timeout")
+            return None
+
+        # Some devices do not implement HEAD, use GET from now on
+        if response.status in HTTP_METHOD_NOT_ALLOWED and self._method == "HEAD":
+            _LOGGER.debug("HEAD not supported by %s, switching to GET", self.url)
+            self._method = "GET"
+
+        return response_time
+
+
+@callback
+@singleton(DATA_HTTP_SESSION)
+def async_get_probe_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the client session shared by the HTTP probes, closed with Home Assistant."""
+    session = aiohttp.ClientSession(
+        # Devices often use self-signed certificates
+        connector=aiohttp.TCPConnector(ssl=False, keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT),
+    )
+
+    async def _async_close(_: Event) -> None:
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+
+    return session
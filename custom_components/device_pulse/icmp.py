@@ -0,0 +1,305 @@
+"""Shared ICMP echo engine for Device Pulse."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import itertools
+import logging
+import os
+import socket
+import struct
+import time
+from typing import Any
+
+from homeassistant.components.ping import PingDataICMPLib, PingDataSubProcess
+from homeassistant.core import HomeAssistant
+
+from .const import ICMP_TIMEOUT
+from .utils import build_ping_data, is_valid_ip, resolve_hostname_to_ip
+
+_LOGGER = logging.getLogger(__name__)
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMP_PAYLOAD = b"device_pulse\x00\x00\x00\x00"
+ICMP_RECV_BUFFER = 1024
+PING_GROUP_RANGE_PATH = "/proc/sys/net/ipv4/ping_group_range"
+
+
+def _checksum(data: bytes) -> int:
+    """Compute the internet checksum of an ICMP packet."""
+    if len(data) % 2:
+        data += b"\x00"
+
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+
+    return ~total & 0xFFFF
+
+
+def _build_echo_request(identifier: int, sequence: int) -> bytes:
+    """Build an ICMP echo request packet."""
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, identifier, sequence)
+    checksum = _checksum(header + ICMP_PAYLOAD)
+
+    return struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, identifier, sequence) + ICMP_PAYLOAD
+
+
+def is_in_ping_group_range() -> bool | None:
+    """Return True if the process groups are allowed to open unprivileged ICMP sockets.
+
+    Returns None when net.ipv4.ping_group_range cannot be read (not Linux).
+    """
+    try:
+        with open(PING_GROUP_RANGE_PATH, encoding="ascii") as file:
+            low, high = (int(value) for value in file.read().split())
+    except (OSError, ValueError):
+        return None
+
+    return any(low <= group <= high for group in {os.getgid(), *os.getgroups()})
+
+
+@dataclass(slots=True)
+class _PendingEcho:
+    """An echo request waiting for its reply."""
+
+    ip_address: str
+    future: asyncio.Future[float | None]
+    sent_at: float = 0.0
+    timer: asyncio.TimerHandle | None = None
+
+
+class IcmpEngine:
+    """Process-wide ICMP engine multiplexing echo requests over one socket.
+
+    Probes submitted during the same event loop iteration are flushed together
+    in a single send pass, and all replies are dispatched by a single reader
+    registered on the socket, so the cost of a probing round no longer grows
+    with one socket and one task per monitored device.
+
+    Without privileges the engine uses an ICMP datagram socket, allowed by
+    Linux when the process groups are within net.ipv4.ping_group_range. The
+    kernel then owns the echo identifier and delivers only the replies of
+    the socket, without the IPv4 header.
+    """
+
+    def __init__(self, hass: HomeAssistant, privileged: bool = True) -> None:
+        """Initialize the engine."""
+        self.hass = hass
+        self.privileged = privileged
+        self._sock: socket.socket | None = None
+        self._identifier = os.getpid() & 0xFFFF
+        self._sequence = itertools.count()
+        self._pending: dict[int, _PendingEcho] = {}
+        self._batch: list[tuple[int, _PendingEcho]] | None = None
+
+    def start(self) -> None:
+        """Open the shared socket and start reading replies."""
+        sock = socket.socket(
+            socket.AF_INET, socket.SOCK_RAW if self.privileged else socket.SOCK_DGRAM, socket.IPPROTO_ICMP
+        )
+        try:
+            sock.setblocking(False)
+            if not self.privileged:
+                # The kernel assigns the echo identifier as the local port of the socket
+                sock.bind(("0.0.0.0", 0))
+                self._identifier = sock.getsockname()[1]
+        except OSError:
+            sock.close()
+            raise
+
+        self._sock = sock
+        self.hass.loop.add_reader(sock.fileno(), self._read_replies)
+        _LOGGER.debug(
+            "ICMP engine started (%s, identifier: %d)",
+            "raw socket" if self.privileged else "datagram socket",
+            self._identifier,
+        )
+
+    def stop(self) -> None:
+        """Close the shared socket and cancel pending requests."""
+        if self._sock is None:
+            return
+
+        self.hass.loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+
+        for pending in self._pending.values():
+            if pending.timer:
+                pending.timer.cancel()
+            if not pending.future.done():
+                pending.future.set_result(None)
+        self._pending.clear()
+        _LOGGER.debug("ICMP engine stopped")
+
+    async def async_ping(
+        self, ip_address: str, count: int = 1, timeout: float = ICMP_TIMEOUT
+    ) -> list[float]:
+        """Send count echo requests to ip_address and return the RTTs (ms) of the replies."""
+        if self._sock is None:
+            return []
+
+        loop = self.hass.loop
+        futures = []
+
+        for _ in range(count):
+            sequence = next(self._sequence) & 0xFFFF
+            # Sequence numbers wrap around, drop a stale request still holding the slot
+            if stale := self._pending.pop(sequence, None):
+                self._resolve(stale, None)
+
+            pending = _PendingEcho(ip_address, loop.create_future())
+            pending.timer = loop.call_later(timeout, self._expire, sequence, pending)
+            self._pending[sequence] = pending
+            self._enqueue(sequence, pending)
+            futures.append(pending.future)
+
+        results = await asyncio.gather(*futures)
+
+        return [rtt for rtt in results if rtt is not None]
+
+    def _enqueue(self, sequence: int, pending: _PendingEcho) -> None:
+        """Queue a request to be sent with the current loop iteration batch."""
+        if self._batch is None:
+            self._batch = []
+            self.hass.loop.call_soon(self._flush)
+
+        self._batch.append((sequence, pending))
+
+    def _flush(self) -> None:
+        """Send all the requests queued during the last loop iteration."""
+        batch, self._batch = self._batch, None
+
+        if batch is None or self._sock is None:
+            return
+
+        for sequence, pending in batch:
+            if pending.future.done():
+                continue
+            packet = _build_echo_request(self._identifier, sequence)
+            try:
+                self._sock.sendto(packet, (pending.ip_address, 0))
+            except OSError as err:
+                _LOGGER.debug("ICMP echo request to %s failed: %s", pending.ip_address, err)
+                self._pending.pop(sequence, None)
+                self._resolve(pending, None)
+                continue
+            pending.sent_at = time.monotonic()
+
+        _LOGGER.debug("ICMP engine flushed %d echo requests", len(batch))
+
+    def _read_replies(self) -> None:
+        """Drain the socket and dispatch every echo reply to its waiter."""
+        while self._sock is not None:
+            try:
+                packet, (source, _) = self._sock.recvfrom(ICMP_RECV_BUFFER)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as err:
+                _LOGGER.debug("ICMP engine receive error: %s", err)
+                return
+
+            received_at = time.monotonic()
+
+            # Raw sockets deliver the IPv4 header in front of the ICMP message
+            header_length = (packet[0] & 0x0F) * 4 if self.privileged else 0
+            icmp = packet[header_length:header_length + 8]
+            if len(icmp) < 8:
+                continue
+
+            icmp_type, _, _, identifier, sequence = struct.unpack("!BBHHH", icmp)
+            if icmp_type != ICMP_ECHO_REPLY or identifier != self._identifier:
+                continue
+
+            pending = self._pending.get(sequence)
+            if pending is None or pending.ip_address != source:
+                continue
+
+            del self._pending[sequence]
+            self._resolve(pending, (received_at - pending.sent_at) * 1000)
+
+    def _expire(self, sequence: int, pending: _PendingEcho) -> None:
+        """Resolve a request that did not get a reply in time."""
+        if self._pending.get(sequence) is pending:
+            del self._pending[sequence]
+        self._resolve(pending, None)
+
+    @staticmethod
+    def _resolve(pending: _PendingEcho, rtt: float | None) -> None:
+        """Resolve the waiter of a request."""
+        if pending.timer:
+            pending.timer.cancel()
+        if not pending.future.done():
+            pending.future.set_result(rtt)
+
+
+class PingDataICMPEngine:
+    """Handle ICMP ping requests through the shared ICMP engine."""
+
+    def __init__(
+        self, hass: HomeAssistant, ip_address: str, count: int, engine: IcmpEngine, escalate: bool = False
+    ) -> None:
+        """Initialize the ICMP ping handler."""
+        self.hass = hass
+        self.ip_address = ip_address
+        self.count = count
+        self.escalate = escalate
+        self.is_alive = False
+        self.data: dict[str, Any] | None = None
+        self._engine = engine
+
+    async def async_update(self) -> None:
+        """Send ICMP echo requests to check if the host is alive."""
+        target = self.ip_address
+        if not is_valid_ip(target) and not (target := await resolve_hostname_to_ip(self.hass, target)):
+            self.is_alive = False
+            self.data = None
+            return
+
+        if self.escalate and self.count > 1:
+            # Send the remaining requests only when the first one times out
+            response_times = (
+                await self._engine.async_ping(target)
+                or await self._engine.async_ping(target, self.count - 1)
+            )
+        else:
+            response_times = await self._engine.async_ping(target, self.count)
+
+        self.is_alive = bool(response_times)
+        self.data = build_ping_data(response_times) if self.is_alive else None
+
+
+class PingDataEscalating:
+    """Send a single ping request first, escalating to the remaining ones on timeout.
+
+    Wraps two ping clients of the ping integration, one sending a single
+    request and one sending the remaining requests of the attempt.
+    """
+
+    def __init__(
+        self,
+        first: PingDataICMPLib | PingDataSubProcess,
+        escalation: PingDataICMPLib | PingDataSubProcess,
+    ) -> None:
+        """Initialize the escalating ping handler."""
+        self.hass = first.hass
+        self.ip_address = first.ip_address
+        self.is_alive = False
+        self.data: dict[str, Any] | None = None
+        self._first = first
+        self._escalation = escalation
+
+    async def async_update(self) -> None:
+        """Send a single request, then the remaining ones if it timed out."""
+        ping = self._first
+        await ping.async_update()
+
+        if not ping.is_alive:
+            ping = self._escalation
+            await ping.async_update()
+
+        self.is_alive = ping.is_alive
+        self.data = ping.data
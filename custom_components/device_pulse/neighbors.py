@@ -0,0 +1,194 @@
+"""Kernel neighbor table monitor for Device Pulse."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import errno
+import logging
+import os
+import socket
+import struct
+import time
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+NETLINK_RECV_BUFFER = 65536
+
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x001
+NLM_F_DUMP = 0x300
+RTM_NEWNEIGH = 28
+RTM_DELNEIGH = 29
+RTM_GETNEIGH = 30
+RTMGRP_NEIGH = 0x4
+
+NDA_DST = 1
+NDA_LLADDR = 2
+NDA_CACHEINFO = 3
+
+NUD_REACHABLE = 0x02
+
+_NLMSG_HEADER = struct.Struct("=IHHII")
+_NDMSG = struct.Struct("=BxxxiHBB")
+_RTATTR = struct.Struct("=HH")
+_NDA_CACHEINFO = struct.Struct("=IIII")
+
+
+def _align(length: int) -> int:
+    """Align a netlink length to 4 bytes."""
+    return (length + 3) & ~3
+
+
+@dataclass(slots=True)
+class _Neighbor:
+    """A neighbor table entry."""
+
+    mac_address: str | None
+    state: int
+    confirmed_at: float
+
+
+class NeighborMonitor:
+    """Keep an index of the kernel neighbor table from netlink notifications.
+
+    The table is dumped once when the monitor starts, then kept up to date
+    from the RTM_NEWNEIGH and RTM_DELNEIGH notifications, so a neighbor
+    recently confirmed REACHABLE by any traffic can be considered alive
+    without sending a probe.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self._sock: socket.socket | None = None
+        self._neighbors: dict[str, _Neighbor] = {}
+        self._clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    def start(self) -> None:
+        """Subscribe to the neighbor notifications and dump the current table."""
+        if not hasattr(socket, "AF_NETLINK"):
+            raise OSError(errno.EAFNOSUPPORT, "Netlink sockets not supported")
+
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        try:
+            sock.bind((0, RTMGRP_NEIGH))
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+
+        self._sock = sock
+        self.hass.loop.add_reader(sock.fileno(), self._read_messages)
+        self._request_dump()
+        _LOGGER.debug("Neighbor monitor started")
+
+    def stop(self) -> None:
+        """Close the netlink socket."""
+        if self._sock is None:
+            return
+
+        self.hass.loop.remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        self._neighbors.clear()
+        _LOGGER.debug("Neighbor monitor stopped")
+
+    def is_reachable(self, ip_address: str, max_age: float) -> bool:
+        """Return True if the neighbor was confirmed REACHABLE within max_age seconds."""
+        neighbor = self._neighbors.get(ip_address)
+
+        return (
+            neighbor is not None
+            and bool(neighbor.state & NUD_REACHABLE)
+            and time.monotonic() - neighbor.confirmed_at <= max_age
+        )
+
+    def _request_dump(self) -> None:
+        """Ask the kernel to dump the IPv4 neighbor table."""
+        if self._sock is None:
+            return
+
+        payload = _NDMSG.pack(socket.AF_INET, 0, 0, 0, 0)
+        header = _NLMSG_HEADER.pack(
+            _NLMSG_HEADER.size + len(payload), RTM_GETNEIGH, NLM_F_REQUEST | NLM_F_DUMP, 1, 0
+        )
+        try:
+            self._sock.send(header + payload)
+        except OSError as err:
+            _LOGGER.debug("Neighbor table dump request failed: %s", err)
+
+    def _read_messages(self) -> None:
+        """Drain the socket and update the index."""
+        while self._sock is not None:
+            try:
+                data = self._sock.recv(NETLINK_RECV_BUFFER)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as err:
+                # Notifications were lost, the index can only be trusted again after a new dump
+                if err.errno == errno.ENOBUFS:
+                    _LOGGER.debug("Neighbor notifications overrun, dumping the table again")
+                    self._neighbors.clear()
+                    self._request_dump()
+                    continue
+                _LOGGER.debug("Neighbor monitor receive error: %s", err)
+                return
+
+            self._parse_messages(data)
+
+    def _parse_messages(self, data: bytes) -> None:
+        """Parse the netlink messages of a datagram."""
+        offset = 0
+
+        while offset + _NLMSG_HEADER.size <= len(data):
+            length, message_type, _, _, _ = _NLMSG_HEADER.unpack_from(data, offset)
+            if length < _NLMSG_HEADER.size:
+                return
+
+            if message_type in (RTM_NEWNEIGH, RTM_DELNEIGH):
+                self._parse_neighbor(
+                    message_type, data[offset + _NLMSG_HEADER.size:offset + length]
+                )
+
+            offset += _align(length)
+
+    def _parse_neighbor(self, message_type: int, payload: bytes) -> None:
+        """Update the index from a neighbor message."""
+        if len(payload) < _NDMSG.size:
+            return
+
+        family, _, state, _, _ = _NDMSG.unpack_from(payload)
+        if family != socket.AF_INET:
+            return
+
+        ip_address = mac_address = None
+        confirmed_ago = 0.0
+        offset = _NDMSG.size
+
+        while offset + _RTATTR.size <= len(payload):
+            attr_length, attr_type = _RTATTR.unpack_from(payload, offset)
+            if attr_length < _RTATTR.size:
+                break
+
+            value = payload[offset + _RTATTR.size:offset + attr_length]
+            if attr_type == NDA_DST and len(value) == 4:
+                ip_address = socket.inet_ntoa(value)
+            elif attr_type == NDA_LLADDR and value:
+                mac_address = value.hex(":")
+            elif attr_type == NDA_CACHEINFO and len(value) >= _NDA_CACHEINFO.size:
+                confirmed, _, _, _ = _NDA_CACHEINFO.unpack_from(value)
+                confirmed_ago = confirmed / self._clock_ticks
+
+            offset += _align(attr_length)
+
+        if ip_address is None:
+            return
+
+        if message_type == RTM_DELNEIGH:
+            self._neighbors.pop(ip_address, None)
+            return
+
+        self._neighbors[ip_address] = _Neighbor(mac_address, state, time.monotonic() - confirmed_ago)
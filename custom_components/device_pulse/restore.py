@@ -0,0 +1,237 @@
+"""Restore the last known state of the device monitors for Device Pulse."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from dataclasses import replace
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import restore_state
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    ENTITY_ATTR_STATE_SINCE,
+    ENTITY_TAG_DISCONNECTED_SINCE,
+    ENTITY_TAG_LAST_RESPONSE_TIME,
+    ENTITY_TAG_PING_STATUS,
+    ENTITY_TAG_PINGS_FAILED_COUNT,
+    STATE_HANDOFF_MAX_AGE,
+    STATE_STORE_MAX_AGE,
+    STATE_STORE_SAVE_DELAY,
+    STATE_STORE_VERSION,
+)
+from .coordinator import CoordinatorState, DevicePingCoordinator
+from .utils import build_entity_unique_id
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_STORE_KEY = f"{DOMAIN}.coordinator_states"
+
+
+class CoordinatorStateStore:
+    """Persist the state of all the device monitors in a single storage file.
+
+    Updates of the registered coordinators only mark the snapshot as dirty,
+    and the whole snapshot is written at most once per save delay, instead of
+    once per device and update. States saved more than STATE_STORE_MAX_AGE
+    ago, e.g. of devices no longer monitored, are not restored and are pruned.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STATE_STORE_VERSION, STATE_STORE_KEY)
+        self._states: dict[str, dict[str, Any]] = {}
+        self._coordinators: dict[str, DevicePingCoordinator] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the saved states, dropping the ones of removed devices or too old."""
+        device_registry = dr.async_get(self.hass)
+        states = await self._store.async_load() or {}
+        now = time.time()
+        self._states = {}
+
+        for device_id, state in states.items():
+            # States saved by previous versions have no timestamp, they expire from now on
+            state.setdefault("saved_at", now)
+            if device_registry.async_get(device_id) and not self._is_expired(state, now):
+                self._states[device_id] = state
+        _LOGGER.debug("Loaded the saved state of %d devices", len(self._states))
+
+    def get_state(self, device_id: str) -> CoordinatorState | None:
+        """Return the saved state of a device, if any."""
+        if not (state := self._states.get(device_id)):
+            return None
+
+        if self._is_expired(state, time.time()):
+            del self._states[device_id]
+            return None
+
+        failed_started_at = state.get("failed_started_at")
+
+        return CoordinatorState(
+            state["is_alive"],
+            state.get("failed_pings", 0),
+            dt_util.parse_datetime(failed_started_at) if failed_started_at else None,
+            state.get("last_response_time"),
+        )
+
+    @callback
+    def async_register(self, coordinator: DevicePingCoordinator) -> CALLBACK_TYPE:
+        """Save the state of a coordinator on its updates, return a callback to stop."""
+        device_id = coordinator.device_entry.id
+        self._coordinators[device_id] = coordinator
+        unsub_listener = coordinator.async_add_listener(self._async_schedule_save)
+
+        @callback
+        def _async_unregister() -> None:
+            unsub_listener()
+            # Keep the last state, the device may be set up again later
+            if self._coordinators.pop(device_id, None) is coordinator and coordinator.data:
+                self._states[device_id] = self._serialize(coordinator.export_state())
+                self._async_schedule_save()
+
+        return _async_unregister
+
+    @callback
+    def async_save_on_final_write(self) -> None:
+        """Make sure the latest states are written when Home Assistant stops."""
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a write of the snapshot, unless one is already pending."""
+        if self._save_pending:
+            return
+
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, STATE_STORE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the snapshot of all the states."""
+        self._save_pending = False
+        now = time.time()
+
+        for device_id, coordinator in self._coordinators.items():
+            if coordinator.data:
+                self._states[device_id] = self._serialize(coordinator.export_state())
+
+        # Keep the states of the devices no longer monitored for a while only
+        self._states = {device_id: state for device_id, state in self._states.items() if not self._is_expired(state, now)}
+
+        return self._states
+
+    @staticmethod
+    def _is_expired(state: dict[str, Any], now: float) -> bool:
+        """Return True if a saved state is too old to be restored."""
+        return now - state.get("saved_at", 0) > STATE_STORE_MAX_AGE
+
+    @staticmethod
+    def _serialize(state: CoordinatorState) -> dict[str, Any]:
+        """Serialize a coordinator state."""
+        return {
+            "is_alive": state.is_alive,
+            "failed_pings": state.failed_pings,
+            "failed_started_at": state.failed_started_at.isoformat() if state.failed_started_at else None,
+            "last_response_time": state.last_response_time,
+            "saved_at": time.time(),
+        }
+
+
+class CoordinatorStateHandoff:
+    """Carry the live state of the device monitors across a reload of their config entry.
+
+    The states are exported when the entry unloads and taken back by the new
+    coordinators of the same devices, so a reload costs no probe round and
+    doesn't go through the first update logic again. States not taken back
+    shortly after, e.g. when the entry was disabled, are dropped. The probe
+    data of a different ping method is not carried over.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the handoff."""
+        self._states: dict[str, tuple[float, str, CoordinatorState]] = {}
+
+    @callback
+    def async_put(self, coordinators: list[DevicePingCoordinator]) -> None:
+        """Hand off the state of coordinators being unloaded, dropping the stale ones."""
+        now = time.monotonic()
+        self._states = {
+            device_id: handoff
+            for device_id, handoff in self._states.items()
+            if now - handoff[0] <= STATE_HANDOFF_MAX_AGE
+        }
+
+        for coordinator in coordinators:
+            if coordinator.data:
+                self._states[coordinator.device_entry.id] = (now, coordinator.ping_method, coordinator.export_state())
+
+    @callback
+    def async_take(self, device_id: str, ping_method: str) -> CoordinatorState | None:
+        """Return the handed off state of a device, if still fresh."""
+        if not (handoff := self._states.pop(device_id, None)):
+            return None
+
+        handed_off_at, handed_off_ping_method, state = handoff
+        if time.monotonic() - handed_off_at > STATE_HANDOFF_MAX_AGE:
+            return None
+
+        # Response times and probe details of another ping method don't apply
+        if handed_off_ping_method != ping_method:
+            state = replace(state, data={}, last_response_time=None)
+
+        return state
+
+
+@callback
+def async_get_restored_state(
+    hass: HomeAssistant, device: dr.DeviceEntry, ping_attempts_before_failure: int
+) -> CoordinatorState | None:
+    """Return the last state of a device monitor, rebuilt from the restored states of its entities.
+
+    Returns None when the ping status of the device was never saved.
+    """
+    entity_registry = er.async_get(hass)
+    last_states = restore_state.async_get(hass).last_states
+
+    def _last_state(platform: str, tag: str) -> State | None:
+        entity_id = entity_registry.async_get_entity_id(platform, DOMAIN, build_entity_unique_id(device, tag))
+        if entity_id and (stored := last_states.get(entity_id)):
+            return stored.state
+        return None
+
+    status = _last_state("binary_sensor", ENTITY_TAG_PING_STATUS)
+    if status is None or status.state not in (STATE_ON, STATE_OFF):
+        return None
+
+    is_alive = status.state == STATE_ON
+    state = CoordinatorState(is_alive, 0 if is_alive else ping_attempts_before_failure)
+
+    # Optional sensors carry the details, when enabled
+    if (failed := _last_state("sensor", ENTITY_TAG_PINGS_FAILED_COUNT)) is not None:
+        with suppress(ValueError):
+            state.failed_pings = int(float(failed.state))
+
+    if not is_alive:
+        if (since := _last_state("sensor", ENTITY_TAG_DISCONNECTED_SINCE)) is not None:
+            state.failed_started_at = dt_util.parse_datetime(since.state)
+        if state.failed_started_at is None and (state_since := status.attributes.get(ENTITY_ATTR_STATE_SINCE)):
+            state.failed_started_at = dt_util.utc_from_timestamp(state_since)
+
+    if (response_time := _last_state("sensor", ENTITY_TAG_LAST_RESPONSE_TIME)) is not None:
+        with suppress(ValueError):
+            state.last_response_time = float(response_time.state)
+
+    _LOGGER.debug("Restored state of device [%s]: %s", device.name, state)
+
+    return state
@@ -0,0 +1,270 @@
+"""Central probe scheduler for Device Pulse."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+import heapq
+import itertools
+import logging
+import math
+from typing import Any
+import zlib
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .budget import ProbeBudget
+from .const import DOMAIN, PROBE_PRIORITY_NORMAL, PROBE_PRIORITY_RANKS, SCHEDULER_SLOT_DURATION
+
+_LOGGER = logging.getLogger(__name__)
+
+ProbeCallback = Callable[[], Awaitable[Any]]
+
+
+@dataclass(slots=True)
+class _ScheduledProbe:
+    """A probe registered on the scheduler."""
+
+    key: str
+    probe: ProbeCallback
+    priority: str
+    packets: int
+    due: Callable[[], bool] | None = None
+
+
+class _TimingWheel:
+    """Timing wheel spreading the probes of one interval class over its slots."""
+
+    def __init__(self, interval: int) -> None:
+        """Initialize the wheel."""
+        self.interval = interval
+        self.slot_count = max(1, round(interval / SCHEDULER_SLOT_DURATION))
+        self.slots: list[dict[str, _ScheduledProbe]] = [{} for _ in range(self.slot_count)]
+        self.position = 0
+        self.unsub: CALLBACK_TYPE | None = None
+
+    def phase(self, key: str) -> int:
+        """Return the deterministic slot of a probe, based on the hash of its key."""
+        return zlib.crc32(key.encode()) % self.slot_count
+
+    def is_empty(self) -> bool:
+        """Return True if no probe is scheduled on the wheel."""
+        return not any(self.slots)
+
+
+class ProbeScheduler:
+    """Dispatch all the probes with a single timer per interval class.
+
+    Every probe gets a fixed phase inside its interval, derived from the hash
+    of its key, so probes are spread evenly instead of firing in bursts. On
+    each tick the probes of the current slot are queued by priority and
+    started as long as the global probe budget allows it, so under contention
+    high priority probes go first and the others wait in the queue instead of
+    piling up on the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.budget = ProbeBudget()
+        self._wheels: dict[int, _TimingWheel] = {}
+        self._intervals: dict[str, int] = {}
+        self._running: dict[str, asyncio.Task[Any]] = {}
+        self._queue: list[tuple[int, int, str]] = []
+        self._queued: dict[str, _ScheduledProbe] = {}
+        self._sequence = itertools.count()
+        self._unsub_retry: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add(
+        self,
+        key: str,
+        interval: int,
+        probe: ProbeCallback,
+        priority: str = PROBE_PRIORITY_NORMAL,
+        packets: int = 1,
+        due: Callable[[], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Schedule probe every interval seconds, return a callback to remove it.
+
+        When due is given, it is called on each slot of the probe and the probe
+        is skipped for that slot if it returns False. Adding a probe again with
+        the same key replaces it, moving it to the new interval if needed.
+        """
+        if self._intervals.get(key, interval) != interval:
+            self._async_detach(key)
+
+        if not (wheel := self._wheels.get(interval)):
+            wheel = self._wheels[interval] = _TimingWheel(interval)
+            wheel.unsub = async_track_time_interval(
+                self.hass,
+                partial(self._async_tick, wheel),
+                timedelta(seconds=SCHEDULER_SLOT_DURATION),
+                name=f"{DOMAIN} probe scheduler ({interval}s)",
+            )
+            _LOGGER.debug("Created timing wheel for interval %ds (%d slots)", interval, wheel.slot_count)
+
+        wheel.slots[wheel.phase(key)][key] = _ScheduledProbe(key, probe, priority, packets, due)
+        self._intervals[key] = interval
+
+        return partial(self.async_remove, key)
+
+    @callback
+    def async_update(self, key: str, interval: int, packets: int | None = None) -> None:
+        """Move a scheduled probe to another interval, updating its packets if given."""
+        if (current := self._intervals.get(key)) is None:
+            return
+
+        wheel = self._wheels[current]
+        scheduled = wheel.slots[wheel.phase(key)][key]
+        self.async_add(
+            key,
+            interval,
+            scheduled.probe,
+            scheduled.priority,
+            scheduled.packets if packets is None else packets,
+            scheduled.due,
+        )
+
+    @callback
+    def async_set_packets(self, key: str, packets: int) -> None:
+        """Update the packets sent by the next runs of a scheduled probe."""
+        if (interval := self._intervals.get(key)) is None:
+            return
+
+        wheel = self._wheels[interval]
+        wheel.slots[wheel.phase(key)][key].packets = packets
+
+    @callback
+    def async_probe_later(
+        self,
+        key: str,
+        delay: float,
+        probe: ProbeCallback,
+        priority: str = PROBE_PRIORITY_NORMAL,
+        packets: int = 1,
+    ) -> CALLBACK_TYPE:
+        """Queue a one-off probe after delay seconds, return a callback to cancel it."""
+        return async_call_later(
+            self.hass, delay, partial(self._async_queue_once, _ScheduledProbe(key, probe, priority, packets))
+        )
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Remove a scheduled probe, cancelling it if queued or running."""
+        self._queued.pop(key, None)
+        if task := self._running.pop(key, None):
+            task.cancel()
+
+        self._async_detach(key)
+
+    @callback
+    def _async_detach(self, key: str) -> None:
+        """Take a probe off its timing wheel, removing the wheel once empty."""
+        if (interval := self._intervals.pop(key, None)) is None or not (wheel := self._wheels.get(interval)):
+            return
+
+        wheel.slots[wheel.phase(key)].pop(key, None)
+
+        if wheel.is_empty():
+            if wheel.unsub:
+                wheel.unsub()
+            del self._wheels[interval]
+            _LOGGER.debug("Removed timing wheel for interval %ds", interval)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop all the timers and cancel queued and running probes."""
+        for wheel in self._wheels.values():
+            if wheel.unsub:
+                wheel.unsub()
+        self._wheels.clear()
+        self._intervals.clear()
+
+        if self._unsub_retry:
+            self._unsub_retry()
+            self._unsub_retry = None
+
+        self._queue.clear()
+        self._queued.clear()
+
+        for task in self._running.values():
+            task.cancel()
+        self._running.clear()
+
+    @callback
+    def _async_tick(self, wheel: _TimingWheel, _: datetime) -> None:
+        """Queue all the probes of the current slot of the wheel."""
+        slot = wheel.slots[wheel.position]
+        wheel.position = (wheel.position + 1) % wheel.slot_count
+
+        for scheduled in slot.values():
+            if scheduled.due and not scheduled.due():
+                continue
+            self._async_queue(scheduled)
+
+        self._async_dispatch()
+
+    @callback
+    def _async_queue_once(self, scheduled: _ScheduledProbe, _: datetime) -> None:
+        """Queue a one-off probe."""
+        self._async_queue(scheduled)
+        self._async_dispatch()
+
+    @callback
+    def _async_queue(self, scheduled: _ScheduledProbe) -> None:
+        """Queue a probe by priority, unless already queued or running."""
+        # Never pile up probes for the same target
+        if scheduled.key in self._running or scheduled.key in self._queued:
+            _LOGGER.debug("Probe [%s] still queued or running, skipping", scheduled.key)
+            return
+
+        self._queued[scheduled.key] = scheduled
+        heapq.heappush(
+            self._queue, (PROBE_PRIORITY_RANKS[scheduled.priority], next(self._sequence), scheduled.key)
+        )
+
+    @callback
+    def _async_retry_dispatch(self, _: datetime) -> None:
+        """Start queued probes once the packets rate allows it."""
+        self._unsub_retry = None
+        self._async_dispatch()
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Start queued probes, by priority, while the budget allows it."""
+        while self._queue:
+            _, __, key = self._queue[0]
+            if not (scheduled := self._queued.get(key)):
+                heapq.heappop(self._queue)
+                continue
+
+            if wait := self.budget.try_acquire(scheduled.packets):
+                _LOGGER.debug("Probe budget exhausted, %d probes deferred", len(self._queued))
+                # Limited by the packets rate, retry once enough tokens are available
+                if wait != math.inf and not self._unsub_retry:
+                    self._unsub_retry = async_call_later(self.hass, wait, self._async_retry_dispatch)
+                return
+
+            heapq.heappop(self._queue)
+            del self._queued[key]
+            self._async_start(scheduled)
+
+    @callback
+    def _async_start(self, scheduled: _ScheduledProbe) -> None:
+        """Start a probe as a background task."""
+        task = self.hass.async_create_background_task(scheduled.probe(), f"{DOMAIN} probe {scheduled.key}")
+        self._running[scheduled.key] = task
+        task.add_done_callback(partial(self._async_probe_done, scheduled.key))
+
+    @callback
+    def _async_probe_done(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Release the budget of a completed probe and start the next ones."""
+        self.budget.release()
+        if self._running.get(key) is task:
+            del self._running[key]
+        self._async_dispatch()
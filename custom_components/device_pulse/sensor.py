@@ -1,9 +1,11 @@
 """Sensor platform for Device Pulse - Network Summary."""
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import ConfigMonitoredDeviceData
 from .const import (
     CONF_ENTRY_TYPE,
     CONF_SENSORS_INTEGRATION_SUMMARY_ENABLED,
@@ -15,6 +17,7 @@ from .const import (
     DEFAULT_SENSORS_FAILED_PINGS_ENABLED,
     DEFAULT_SENSORS_LAST_RESPONSE_TIME_ENABLED,
     ENTRY_TYPE_NETWORK_SUMMARY,
+    SIGNAL_MONITOR_ADDED,
 )
 from .entities import (
     DeviceDisconnectedSinceSensor,
@@ -58,5 +61,15 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     if entities:
         async_add_entities(entities)
 
+    @callback
+    def _async_monitor_added(monitored: ConfigMonitoredDeviceData) -> None:
+        """Add the entities of a monitor created after the setup."""
+        if sensors:
+            async_add_entities([sensor(monitored.coordinator, monitored.device, integration) for sensor in sensors])
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_MONITOR_ADDED.format(config_entry.entry_id), _async_monitor_added)
+    )
+
     # Clean up orphan entities
     remove_config_entry_orphan_entities(hass, config_entry, entities, "sensor")
@@ -0,0 +1,124 @@
+"""Index of the local IPv4 subnets for Device Pulse."""
+
+from __future__ import annotations
+
+import ipaddress
+import logging
+
+from homeassistant.components.network import Adapter, async_get_adapters, async_get_source_ip
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SUBNET_INDEX: HassKey[SubnetIndex] = HassKey(f"{DOMAIN}_subnet_index")
+
+AdapterMatch = tuple[Adapter | None, str | None, int | None]
+
+
+class SubnetIndex:
+    """Answer which adapter serves an IP address, and if it is on a local subnet.
+
+    The IPv4 networks of all the adapters are indexed by prefix length, so a
+    lookup costs one dictionary access per distinct prefix length, without
+    enumerating the adapters or building network objects. The index is built
+    again whenever Home Assistant loads a new list of adapters.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._adapters: list[Adapter] | None = None
+        # Prefix length -> network address -> adapter and its address, longest prefixes first
+        self._networks: dict[int, dict[int, tuple[Adapter, str]]] = {}
+        # Adapters routing the addresses outside the local subnets
+        self._routes: dict[str, AdapterMatch] = {}
+
+    async def async_get_local_adapter(self, ip_address: str) -> AdapterMatch:
+        """Return the adapter, its address and prefix when ip_address is on one of its subnets."""
+        await self._async_ensure_index()
+        address = int(ipaddress.IPv4Address(ip_address))
+
+        for prefix, networks in self._networks.items():
+            if match := networks.get(address & _netmask(prefix)):
+                adapter, adapter_ip = match
+                return adapter, adapter_ip, prefix
+
+        return None, None, None
+
+    async def async_get_adapter(self, ip_address: str) -> AdapterMatch:
+        """Return the adapter, its address and prefix used to reach ip_address."""
+        if (match := await self.async_get_local_adapter(ip_address))[0]:
+            return match
+
+        if (route := self._routes.get(ip_address)) is None:
+            route = self._routes[ip_address] = await self._async_get_route_adapter(ip_address)
+
+        return route
+
+    async def _async_get_route_adapter(self, ip_address: str) -> AdapterMatch:
+        """Return the adapter holding the source address of the route to ip_address."""
+        if not (ha_ip := await async_get_source_ip(self.hass, target_ip=ip_address)):
+            _LOGGER.debug("Cannot determine Home Assistant IP address")
+            return None, None, None
+
+        for networks in self._networks.values():
+            for adapter, adapter_ip in networks.values():
+                if adapter_ip == ha_ip:
+                    return adapter, ha_ip, _get_prefix(adapter, ha_ip)
+
+        return None, None, None
+
+    async def _async_ensure_index(self) -> None:
+        """Build the index, unless the adapters didn't change since the last build."""
+        adapters = await async_get_adapters(self.hass)
+        if adapters is self._adapters:
+            return
+
+        self._async_build(adapters)
+
+    @callback
+    def _async_build(self, adapters: list[Adapter]) -> None:
+        """Index the IPv4 networks of the adapters."""
+        networks: dict[int, dict[int, tuple[Adapter, str]]] = {}
+
+        for adapter in adapters:
+            for ip_info in adapter.get("ipv4", []):
+                address, prefix = ip_info.get("address"), ip_info.get("network_prefix")
+                if not address or prefix is None:
+                    continue
+                network = int(ipaddress.IPv4Address(address)) & _netmask(prefix)
+                networks.setdefault(prefix, {}).setdefault(network, (adapter, address))
+
+        self._adapters = adapters
+        self._networks = dict(sorted(networks.items(), reverse=True))
+        self._routes.clear()
+
+        _LOGGER.debug(
+            "Indexed %d local subnets of %d network adapters",
+            sum(len(by_network) for by_network in networks.values()),
+            len(adapters),
+        )
+
+
+def _netmask(prefix: int) -> int:
+    """Return the IPv4 netmask of a prefix length as an integer."""
+    return (0xFFFFFFFF << (32 - prefix)) & 0xFFFFFFFF
+
+
+def _get_prefix(adapter: Adapter, address: str) -> int | None:
+    """Return the prefix length of an address of the adapter."""
+    for ip_info in adapter.get("ipv4", []):
+        if ip_info.get("address") == address:
+            return ip_info.get("network_prefix")
+    return None
+
+
+@callback
+@singleton(DATA_SUBNET_INDEX)
+def async_get_subnet_index(hass: HomeAssistant) -> SubnetIndex:
+    """Return the subnet index shared by all the monitors and flows."""
+    return SubnetIndex(hass)
@@ -0,0 +1,150 @@
+"""TCP connect probing for Device Pulse."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import TCP_AUTO_PORTS, TCP_DETECT_BACKOFF_MAX, TCP_MAX_CONCURRENT_CONNECTS, TCP_TIMEOUT
+from .utils import build_ping_data, is_valid_ip, resolve_hostname_to_ip
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TcpProber:
+    """Measure TCP connect times with non-blocking sockets on the event loop.
+
+    All the connects share a global cap, so a large number of TCP monitors
+    never opens more sockets at once than the cap allows. A refused
+    connection still proves the host is up, so it counts as a reply.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int = TCP_MAX_CONCURRENT_CONNECTS) -> None:
+        """Initialize the prober."""
+        self.hass = hass
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def async_connect(self, ip_address: str, port: int, timeout: float = TCP_TIMEOUT) -> float | None:
+        """Connect to ip_address:port and return the connect time (ms), None on timeout."""
+        response_time, _ = await self._async_connect(ip_address, port, timeout)
+
+        return response_time
+
+    async def async_detect_port(self, ip_address: str) -> tuple[int, float] | None:
+        """Connect to all the well-known ports at once and return the best answering one.
+
+        The first port accepting the connection is preferred, otherwise the
+        first port refusing it.
+        """
+
+        async def _async_connect_port(port: int) -> tuple[int, float | None, bool]:
+            return port, *await self._async_connect(ip_address, port, TCP_TIMEOUT)
+
+        refused: tuple[int, float] | None = None
+        tasks = [asyncio.ensure_future(_async_connect_port(port)) for port in TCP_AUTO_PORTS]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                port, response_time, accepted = await next_done
+                if response_time is None:
+                    continue
+                if accepted:
+                    return port, response_time
+                refused = refused or (port, response_time)
+        finally:
+            # Pending connects are cancelled, closing their sockets
+            for task in tasks:
+                task.cancel()
+
+        return refused
+
+    async def _async_connect(self, ip_address: str, port: int, timeout: float) -> tuple[float | None, bool]:
+        """Connect to ip_address:port, return the connect time (ms) and if it was accepted."""
+        async with self._semaphore:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            started_at = time.perf_counter()
+            accepted = True
+            try:
+                async with asyncio.timeout(timeout):
+                    await self.hass.loop.sock_connect(sock, (ip_address, port))
+            except ConnectionRefusedError:
+                accepted = False
+            except (TimeoutError, OSError) as err:
+                _LOGGER.debug("TCP connect to %s:%d failed: %s", ip_address, port, err or "timeout")
+                return None, False
+            finally:
+                sock.close()
+
+            return round((time.perf_counter() - started_at) * 1000, 3), accepted
+
+
+class PingDataTCP:
+    """Handle TCP connect probes with the shared TCP prober."""
+
+    def __init__(
+        self, hass: HomeAssistant, ip_address: str, count: int, prober: TcpProber, port: int = 0
+    ) -> None:
+        """Initialize the TCP ping handler, with port 0 to detect it automatically."""
+        self.hass = hass
+        self.ip_address = ip_address
+        self.count = count
+        self.port = port
+        self.is_alive = False
+        self.data: dict[str, Any] | None = None
+        self._prober = prober
+        self._auto_port = not port
+        # Updates left before the next port detection, and the backoff between detections
+        self._detect_in = 0
+        self._detect_backoff = 1
+
+    @property
+    def packets(self) -> int:
+        """Return the connects sent by the next update."""
+        return len(TCP_AUTO_PORTS) if self._is_detection_due() else self.count
+
+    def _is_detection_due(self) -> bool:
+        """Return True if the next update detects the port again."""
+        return self._auto_port and self._detect_in <= 0
+
+    async def async_update(self) -> None:
+        """Connect to the device port to check if the host is alive."""
+        target = self.ip_address
+        if not is_valid_ip(target) and not (target := await resolve_hostname_to_ip(self.hass, target)):
+            self.is_alive = False
+            self.data = None
+            return
+
+        response_times = []
+        detecting = self._is_detection_due()
+
+        if detecting:
+            if detected := await self._prober.async_detect_port(target):
+                self.port, response_time = detected
+                response_times.append(response_time)
+                _LOGGER.debug("Detected TCP port %d for %s", self.port, self.ip_address)
+        elif self.port:
+            # Stop at the first connect answered, like the ARP probes
+            for _ in range(self.count):
+                if (response_time := await self._prober.async_connect(target, self.port)) is not None:
+                    response_times.append(response_time)
+                    break
+
+        if self._auto_port:
+            if response_times:
+                # The last port may have been closed, detect it again after a failure
+                self._detect_in = 1
+                self._detect_backoff = 1
+            elif detecting:
+                # Keep the last port, and detect again less and less often while offline
+                self._detect_in = self._detect_backoff
+                self._detect_backoff = min(self._detect_backoff * 2, TCP_DETECT_BACKOFF_MAX)
+            else:
+                self._detect_in -= 1
+
+        self.is_alive = bool(response_times)
+        self.data = build_ping_data(response_times) if self.is_alive else None
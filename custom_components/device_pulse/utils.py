@@ -1,14 +1,17 @@
 """Utility functions for Device Pulse integration."""
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 import ipaddress
+import itertools
 import logging
 import re
 import socket
-from zeroconf.asyncio import AsyncServiceInfo
+from typing import Any, TypeVar
 
 from homeassistant.config_entries import ConfigEntry, SOURCE_ZEROCONF
 from homeassistant.components import zeroconf
-from homeassistant.components.network import async_get_adapters, async_get_source_ip, Adapter
+from homeassistant.components.network import Adapter
 from homeassistant.core import HomeAssistant
 from homeassistant.loader import async_get_integration
 from homeassistant.helpers import device_registry as dr, entity_registry as er
@@ -27,11 +30,19 @@ from .const import (
     HOST_SOURCE_CUSTOM_RESOLVER,
     HOST_SOURCE_CONFIG_ENTRY,
     HOST_SOURCE_ZEROCONF,
+    SETUP_MAX_CONCURRENCY,
+    SETUP_RAMP_UP_DELAY,
 )
+from .dns import async_get_dns_cache
+from .host_cache import async_get_host_cache
 from .host_resolvers import resolve as resolve_host
+from .subnets import async_get_subnet_index
+from .zeroconf_lookup import async_get_zeroconf_lookup
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 async def async_get_integration_name(hass: HomeAssistant, domain: str) -> str:
     """Return the friendly name for an integration."""
@@ -50,33 +61,9 @@ class IntegrationData:
     device_count: int
     custom_group: bool
 
-async def get_valid_integrations_for_monitoring(hass: HomeAssistant, zc: zeroconf.models.HaZeroconf) -> dict[str, IntegrationData]:
-    """Find all integrations that have devices with a hostname or IP address in the configuration."""
-    device_registry = dr.async_get(hass)
-    integrations: dict[str, IntegrationData] = {}
-
-    all_devices = list(device_registry.devices.values())
-
-    for device in all_devices:
-        if not is_device_valid_for_monitoring(hass, device_registry, device):
-            continue
-        # Get the primary config entry for the device
-        device_config_entry = hass.config_entries.async_get_entry(device.primary_config_entry)
-        # Check if the configuration contains a valid Host parameter
-        host, _ = await extract_device_host(hass, device, zc, device_config_entry)
-
-        if host and device_config_entry.domain not in integrations:
-            # Get the friendly name of the integration
-            friendly_name = await async_get_integration_name(hass, device_config_entry.domain)
-            integrations[device_config_entry.domain] = IntegrationData(device_config_entry.domain, friendly_name, 0, False)
-
-        if host:
-            # Increment the device count for the integration
-            integrations[device_config_entry.domain].device_count += 1
 
-    return integrations
-
-async def _async_get_host_from_zeroconf(zc: zeroconf.models.HaZeroconf, config_entry: ConfigEntry) -> str | None:
+def _get_zeroconf_service(config_entry: ConfigEntry) -> tuple[str, str] | None:
+    """Return the service type and name a config entry was discovered with through zeroconf."""
     try:
         service_type = config_entry.discovery_keys["zeroconf"][0].key[0]
         service_name = config_entry.discovery_keys["zeroconf"][0].key[1]
@@ -84,14 +71,18 @@ async def _async_get_host_from_zeroconf(zc: zeroconf.models.HaZeroconf, config_e
         _LOGGER.warning("Unable to get zeroconf discovery info for [%s][%s]: %s", config_entry.domain, config_entry.title, config_entry.discovery_keys)
         return None
 
-    service_info = AsyncServiceInfo(service_type, service_name)
+    return service_type, service_name
+
+
+async def _async_get_host_from_zeroconf(
+    hass: HomeAssistant, zc: zeroconf.models.HaZeroconf, config_entry: ConfigEntry
+) -> str | None:
+    """Return the IPv4 address of the zeroconf service a config entry was discovered with."""
+    if not (key := _get_zeroconf_service(config_entry)):
+        return None
 
-    if await service_info.async_request(zc, timeout=1500):
-        for address in service_info.addresses:
-            if len(address) == 4:
-                return str(ipaddress.IPv4Address(address))
+    return await async_get_zeroconf_lookup(hass).async_get_host(zc, *key)
 
-    return None
 
 async def get_device_entities(
     hass: HomeAssistant,
@@ -240,6 +231,12 @@ def is_device_valid_for_monitoring(
     return True
 
 
+def build_entity_unique_id(device: dr.DeviceEntry, tag: str) -> str:
+    """Build the unique id of a Device Pulse entity of a device."""
+    device_id = next(iter(device.identifiers), (None, device.id))[1]
+
+    return f"{DOMAIN}_{device_id}_{tag}"
+
 def is_tagged_entity_entry(entry: EntityEntry, tag: str) -> bool:
     """Check if entity is a tagged entity entry of the integration."""
     return (
@@ -248,6 +245,46 @@ def is_tagged_entity_entry(entry: EntityEntry, tag: str) -> bool:
         and tag in entry.unique_id
     )
 
+async def async_run_bounded(
+    action: Callable[[_T], Awaitable[None]], items: list[_T], max_workers: int, ramp_up_delay: float
+) -> None:
+    """Run action on all the items with a bounded pool of workers.
+
+    Workers are started one every ramp_up_delay seconds, so the load grows
+    progressively up to max_workers actions running at the same time. The
+    first error cancels the other workers and is raised as is.
+    """
+    pending = iter(items)
+
+    async def _async_worker(index: int) -> None:
+        await asyncio.sleep(index * ramp_up_delay)
+        for item in pending:
+            await action(item)
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            for index in range(min(max_workers, len(items))):
+                task_group.create_task(_async_worker(index))
+    except ExceptionGroup as err:
+        # Callers handle the error of an action, e.g. ConfigEntryNotReady, not a group
+        raise err.exceptions[0] from None
+
+def build_ping_data(response_times: list[float]) -> dict[str, Any]:
+    """Build timing data in the same format as the ping integration."""
+    avg = sum(response_times) / len(response_times)
+    jitter = (
+        sum(abs(a - b) for a, b in itertools.pairwise(response_times)) / (len(response_times) - 1)
+        if len(response_times) > 1
+        else 0.0
+    )
+
+    return {
+        "min": min(response_times),
+        "max": max(response_times),
+        "avg": avg,
+        "jitter": jitter,
+    }
+
 def is_valid_ip(value: str) -> bool:
     """Check if a value is a valid IPv4 address."""
     try:
@@ -273,12 +310,34 @@ def is_valid_hostname_or_ip(value) -> bool:
 async def extract_device_host(
     hass: HomeAssistant, device: dr.DeviceEntry, zc: zeroconf.models.HaZeroconf, device_config_entry: ConfigEntry | None = None
 ) -> tuple[str | None, str | None]:
-    """Extract Host for device based on integration type."""
+    """Extract Host for device based on integration type, from the host cache when still valid."""
     # Get the primary config entry for the device
     device_config_entry = device_config_entry or hass.config_entries.async_get_entry(
         device.primary_config_entry
     )
 
+    host_cache = await async_get_host_cache(hass)
+    if (cached := host_cache.async_get(device, device_config_entry)) is not None:
+        return cached
+
+    host, source = await _async_discover_device_host(hass, device, zc, device_config_entry)
+
+    # A zeroconf query may fail only because the device is offline, try again next time
+    if not host and device_config_entry.source == SOURCE_ZEROCONF:
+        return host, source
+
+    # Zeroconf announcements of the service may bring a new host
+    zeroconf_service = _get_zeroconf_service(device_config_entry) if source == HOST_SOURCE_ZEROCONF else None
+    host_cache.async_set(
+        device, device_config_entry, host, source, zc, zeroconf_service[1] if zeroconf_service else None
+    )
+
+    return host, source
+
+async def _async_discover_device_host(
+    hass: HomeAssistant, device: dr.DeviceEntry, zc: zeroconf.models.HaZeroconf, device_config_entry: ConfigEntry
+) -> tuple[str | None, str | None]:
+    """Discover the Host of a device through its config entry, resolvers or zeroconf."""
     host = None
     source = None
 
@@ -308,7 +367,7 @@ async def extract_device_host(
 
     # Last chance, check if device was added through zeroconf and query it
     if not host and device_config_entry.source == SOURCE_ZEROCONF:
-        if host := await _async_get_host_from_zeroconf(zc, device_config_entry):
+        if host := await _async_get_host_from_zeroconf(hass, zc, device_config_entry):
             source = HOST_SOURCE_ZEROCONF
             _LOGGER.debug("Found Host '%s' from zeroconf for device %s", host, device.name)
 
@@ -336,20 +395,8 @@ def format_duration(seconds: float) -> str:
 
 
 async def resolve_hostname_to_ip(hass: HomeAssistant, hostname: str) -> str | None:
-    """Resolve a hostname to an IP address."""
-    try:
-        # Use executor to avoid blocking the event loop
-        ip_address = await hass.async_add_executor_job(
-            socket.gethostbyname, hostname
-        )
-        _LOGGER.debug("Resolved hostname %s to IP %s", hostname, ip_address)
-        return ip_address
-    except socket.gaierror as err:
-        _LOGGER.debug("Failed to resolve hostname %s: %s", hostname, err)
-        return None
-    except Exception as err:
-        _LOGGER.warning("Unexpected error resolving hostname %s: %s", hostname, err)
-        return None
+    """Resolve a hostname to an IP address, through the shared DNS cache."""
+    return await async_get_dns_cache(hass).async_resolve(hostname)
 
 async def is_arping_available(hass: HomeAssistant) -> bool:
     """Check if arping command is available on the system."""
@@ -369,26 +416,23 @@ async def is_arping_available(hass: HomeAssistant) -> bool:
         _LOGGER.warning("Error checking arping availability: %s", err)
         return False
 
-async def get_network_adapter_for_ip(hass: HomeAssistant, ip_address: str) -> tuple[Adapter | None, str | None, int | None]:
-    """Get the network adapter for an IP address, returns also HA IP address and netmask."""
-    ha_ip = await async_get_source_ip(hass, target_ip=ip_address)
-    if not ha_ip:
-        _LOGGER.debug("Cannot determine Home Assistant IP address")
-        return None, None, None
-
-    # Get network adapters information to retrieve actual subnet mask
-    adapters = await async_get_adapters(hass)
-    if not adapters:
-        _LOGGER.debug("Cannot retrieve network adapters information")
-        return None, None, None
+async def is_arp_socket_available(hass: HomeAssistant) -> bool:
+    """Check if native ARP requests can be sent through AF_PACKET sockets."""
+    try:
+        sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(0x0806))
+    except AttributeError:
+        _LOGGER.debug("AF_PACKET sockets not supported on this platform")
+        return False
+    except OSError as err:
+        _LOGGER.debug("Cannot open AF_PACKET socket: %s", err)
+        return False
 
-    # Find the adapter that has the HA IP and get its subnet mask
-    for adapter in adapters:
-        for ip_info in adapter.get("ipv4", []):
-            if ip_info.get("address") == ha_ip:
-                return adapter, ha_ip, ip_info.get("network_prefix")
+    sock.close()
+    return True
 
-    return None, None, None
+async def get_network_adapter_for_ip(hass: HomeAssistant, ip_address: str) -> tuple[Adapter | None, str | None, int | None]:
+    """Get the network adapter for an IP address, returns also HA IP address and netmask."""
+    return await async_get_subnet_index(hass).async_get_adapter(ip_address)
 
 
 async def is_host_in_local_subnet(hass: HomeAssistant, host: str) -> bool | str:
@@ -405,29 +449,19 @@ async def is_host_in_local_subnet(hass: HomeAssistant, host: str) -> bool | str:
         else:
             host_ip = host
 
-        # Find the adapter that has the HA IP and get its subnet mask
-        adapter, ha_ip, ha_netmask = await get_network_adapter_for_ip(hass, host_ip)
-        if not adapter:
-            _LOGGER.debug("Cannot determine subnet for IP %s: no matching adapter found", host_ip)
-            return False
-
-        # Create networks with actual subnet mask
-        host_network = ipaddress.IPv4Network(f"{host_ip}/{ha_netmask}", strict=False)
-        ha_network = ipaddress.IPv4Network(f"{ha_ip}/{ha_netmask}", strict=False)
-
-        in_same_subnet = host_network == ha_network
+        # Find the adapter having a subnet that contains the host
+        adapter, ha_ip, ha_netmask = await async_get_subnet_index(hass).async_get_local_adapter(host_ip)
 
         _LOGGER.debug(
-            "Subnet check: host=%s (%s), HA=%s (%s), mask=/%s, same_subnet=%s",
+            "Subnet check: host=%s (%s), HA=%s, mask=/%s, same_subnet=%s",
             host,
-            host_network,
+            host_ip,
             ha_ip,
-            ha_network,
             ha_netmask,
-            in_same_subnet,
+            adapter is not None,
         )
 
-        return host_ip if in_same_subnet else False
+        return host_ip if adapter else False
 
     except (ValueError, ipaddress.AddressValueError) as err:
         _LOGGER.debug("Error checking subnet for %s: %s", host, err)
@@ -445,15 +479,22 @@ async def check_integration_devices_support_arp_ping(
     Returns:
         tuple[bool, str | None]: (supports_arp, reason_if_not_supported)
     """
-    # First, check if arping is available
-    if not await is_arping_available(hass):
-        _LOGGER.debug("arping not available, ARP ping not supported")
+    # First, check if native ARP sockets or arping are available
+    if not await is_arp_socket_available(hass) and not await is_arping_available(hass):
+        _LOGGER.debug("ARP sockets and arping not available, ARP ping not supported")
         return False, "arping_not_installed"
 
-    # Then check if any device is in the local subnet
-    for device in devices:
-        host, _ = await extract_device_host(hass, device, zc)
-        if host and await is_host_in_local_subnet(hass, host):
+    # Then check if any device is in the local subnet, extracting the hosts with a bounded concurrency
+    hosts: list[str] = []
+
+    async def _async_extract_host(device: dr.DeviceEntry) -> None:
+        if (host := (await extract_device_host(hass, device, zc))[0]):
+            hosts.append(host)
+
+    await async_run_bounded(_async_extract_host, devices, SETUP_MAX_CONCURRENCY, SETUP_RAMP_UP_DELAY)
+
+    for host in hosts:
+        if await is_host_in_local_subnet(hass, host):
             return True, None
 
     return False, "no_local_devices"
@@ -464,9 +505,9 @@ async def check_custom_group_devices_support_arp_ping(hass: HomeAssistant, devic
     Returns:
         tuple[bool, str | None]: (supports_arp, reason_if_not_supported)
     """
-    # First, check if arping is available
-    if not await is_arping_available(hass):
-        _LOGGER.debug("arping not available, ARP ping not supported")
+    # First, check if native ARP sockets or arping are available
+    if not await is_arp_socket_available(hass) and not await is_arping_available(hass):
+        _LOGGER.debug("ARP sockets and arping not available, ARP ping not supported")
         return False, "arping_not_installed"
 
     # Then check if any device is in the local subnet
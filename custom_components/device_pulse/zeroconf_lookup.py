@@ -0,0 +1,79 @@
+"""Shared zeroconf host lookups for Device Pulse."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+
+from zeroconf.asyncio import AsyncServiceInfo
+
+from homeassistant.components import zeroconf
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, ZEROCONF_LOOKUP_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ZEROCONF_LOOKUP: HassKey[ZeroconfLookup] = HassKey(f"{DOMAIN}_zeroconf_lookup")
+
+
+class ZeroconfLookup:
+    """Look up the IPv4 address of zeroconf services.
+
+    The records cached by the shared zeroconf instance are used first, and
+    only a missing address is queried on the network. Concurrent lookups of
+    the same service, e.g. by the devices of the same config entry, share a
+    single query.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the lookups."""
+        self.hass = hass
+        self._pending: dict[tuple[str, str], asyncio.Task[str | None]] = {}
+
+    async def async_get_host(self, zc: zeroconf.models.HaZeroconf, service_type: str, service_name: str) -> str | None:
+        """Return the IPv4 address of a zeroconf service, None if not found."""
+        key = (service_type, service_name)
+
+        if not (lookup := self._pending.get(key)):
+            lookup = self._pending[key] = self.hass.async_create_background_task(
+                self._async_query(zc, service_type, service_name), f"{DOMAIN} zeroconf lookup {service_name}"
+            )
+            lookup.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        # A cancelled caller doesn't cancel the lookup shared with the other ones
+        return await asyncio.shield(lookup)
+
+    async def _async_query(self, zc: zeroconf.models.HaZeroconf, service_type: str, service_name: str) -> str | None:
+        """Return the IPv4 address of a zeroconf service, from the shared cache when available."""
+        service_info = AsyncServiceInfo(service_type, service_name)
+
+        # The records cached by the shared zeroconf instance often already hold the address
+        service_info.load_from_cache(zc)
+        if not (host := _get_ipv4(service_info)) and await service_info.async_request(
+            zc, timeout=ZEROCONF_LOOKUP_TIMEOUT
+        ):
+            host = _get_ipv4(service_info)
+
+        _LOGGER.debug("Zeroconf lookup of %s returned %s", service_name, host)
+
+        return host
+
+
+def _get_ipv4(service_info: AsyncServiceInfo) -> str | None:
+    """Return the first IPv4 address of a zeroconf service."""
+    for address in service_info.addresses:
+        if len(address) == 4:
+            return str(ipaddress.IPv4Address(address))
+
+    return None
+
+
+@callback
+@singleton(DATA_ZEROCONF_LOOKUP)
+def async_get_zeroconf_lookup(hass: HomeAssistant) -> ZeroconfLookup:
+    """Return the zeroconf lookups shared by the setup and the config flows."""
+    return ZeroconfLookup(hass)
@@ -0,0 +1 @@
+"""Tests for the Device Pulse integration."""
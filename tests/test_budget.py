@@ -0,0 +1,70 @@
+"""Tests for the global probe budget."""
+
+import math
+
+import pytest
+
+from custom_components.device_pulse import budget as budget_module
+from custom_components.device_pulse.budget import ProbeBudget
+
+
+class _Clock:
+    """Monotonic clock moved forward by the tests."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Replace the monotonic clock of the budget."""
+    clock = _Clock()
+    monkeypatch.setattr(budget_module.time, "monotonic", clock)
+    return clock
+
+
+def test_packets_rate_defers_until_refilled(clock: _Clock) -> None:
+    """A probe exceeding the remaining tokens waits for the bucket to refill."""
+    budget = ProbeBudget(max_in_flight=10, max_packets_per_second=4)
+
+    assert budget.try_acquire(3) == 0
+    # One token left, two more are needed at 4 packets per second
+    assert budget.try_acquire(3) == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert budget.try_acquire(3) == 0
+    assert budget.in_flight == 2
+
+
+def test_in_flight_limit(clock: _Clock) -> None:
+    """Probes beyond the in flight limit wait for a release, whatever the tokens."""
+    budget = ProbeBudget(max_in_flight=1, max_packets_per_second=100)
+
+    assert budget.try_acquire(1) == 0
+    assert budget.try_acquire(1) == math.inf
+
+    budget.release()
+    assert budget.try_acquire(1) == 0
+
+
+def test_probe_larger_than_bucket_starts_when_full(clock: _Clock) -> None:
+    """A probe sending more packets than the bucket holds is not starved."""
+    budget = ProbeBudget(max_in_flight=10, max_packets_per_second=5)
+
+    assert budget.try_acquire(14) == 0
+    assert budget.try_acquire(14) == pytest.approx(1.0)
+
+    clock.now += 1
+    assert budget.try_acquire(14) == 0
+
+
+def test_configure_caps_tokens(clock: _Clock) -> None:
+    """Lowering the rate drops the tokens above the new bucket size."""
+    budget = ProbeBudget(max_in_flight=10, max_packets_per_second=100)
+    budget.configure(10, 2)
+
+    assert budget.try_acquire(2) == 0
+    assert budget.try_acquire(1) == pytest.approx(0.5)
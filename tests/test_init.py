@@ -0,0 +1,14 @@
+"""Tests for the Device Pulse package and its platforms."""
+
+import importlib
+
+from custom_components.device_pulse.const import PLATFORMS
+
+
+def test_platforms_import() -> None:
+    """The integration and all its platforms can be imported."""
+    importlib.import_module("custom_components.device_pulse")
+    importlib.import_module("custom_components.device_pulse.config_flow")
+
+    for platform in PLATFORMS:
+        importlib.import_module(f"custom_components.device_pulse.{platform}")
@@ -0,0 +1,140 @@
+"""Tests for the central probe scheduler."""
+
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.device_pulse import scheduler as scheduler_module
+from custom_components.device_pulse.const import (
+    PROBE_PRIORITY_BEST_EFFORT,
+    PROBE_PRIORITY_CRITICAL,
+    PROBE_PRIORITY_NORMAL,
+)
+from custom_components.device_pulse.scheduler import ProbeScheduler, _TimingWheel
+
+
+async def _probe() -> None:
+    """Probe doing nothing."""
+
+
+class _FakeHass:
+    """Record the probes started by the scheduler, without running them."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.tasks: dict[str, MagicMock] = {}
+
+    def async_create_background_task(self, coro, name: str) -> MagicMock:
+        coro.close()
+        key = name.rsplit(" ", 1)[-1]
+        self.started.append(key)
+        task = self.tasks[key] = MagicMock()
+        return task
+
+    def finish(self, key: str) -> None:
+        """Complete a started probe."""
+        task = self.tasks[key]
+        for call in task.add_done_callback.call_args_list:
+            call.args[0](task)
+
+
+@pytest.fixture
+def timers(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    """Capture the timers of the scheduler instead of running them."""
+    timers: dict[str, list] = {"intervals": [], "later": []}
+
+    def _track_time_interval(hass, action, interval, *, name=None):
+        unsub = MagicMock()
+        timers["intervals"].append((action, unsub))
+        return unsub
+
+    def _call_later(hass, delay, action):
+        timers["later"].append((delay, action))
+        return MagicMock()
+
+    monkeypatch.setattr(scheduler_module, "async_track_time_interval", _track_time_interval)
+    monkeypatch.setattr(scheduler_module, "async_call_later", _call_later)
+    return timers
+
+
+def test_phases_are_deterministic_and_spread() -> None:
+    """Probes get a stable slot and are spread over the whole wheel."""
+    wheel = _TimingWheel(60)
+    keys = [f"device_{index}" for index in range(6000)]
+
+    assert [wheel.phase(key) for key in keys] == [_TimingWheel(60).phase(key) for key in keys]
+
+    per_slot = Counter(wheel.phase(key) for key in keys)
+    assert len(per_slot) == wheel.slot_count
+    # 100 probes per slot on average, no burst several times larger
+    assert max(per_slot.values()) < 2 * len(keys) / wheel.slot_count
+
+
+def test_update_moves_probe_between_wheels(timers: dict[str, list]) -> None:
+    """Updating the interval moves the probe, removing the wheel left empty."""
+    scheduler = ProbeScheduler(_FakeHass())
+    scheduler.async_add("device", 30, _probe, PROBE_PRIORITY_CRITICAL, 2)
+    (_, unsub_30s), = timers["intervals"]
+
+    scheduler.async_update("device", 60, 5)
+
+    assert set(scheduler._wheels) == {60}
+    unsub_30s.assert_called_once()
+    wheel = scheduler._wheels[60]
+    scheduled = wheel.slots[wheel.phase("device")]["device"]
+    assert scheduled.probe is _probe
+    assert scheduled.priority == PROBE_PRIORITY_CRITICAL
+    assert scheduled.packets == 5
+
+
+def test_update_keeps_packets_when_not_given(timers: dict[str, list]) -> None:
+    """Updating only the interval keeps the packets of the probe."""
+    scheduler = ProbeScheduler(_FakeHass())
+    scheduler.async_add("device", 30, _probe, PROBE_PRIORITY_NORMAL, 3)
+    scheduler.async_add("other", 30, _probe)
+
+    scheduler.async_update("device", 120)
+
+    assert set(scheduler._wheels) == {30, 120}
+    wheel = scheduler._wheels[120]
+    assert wheel.slots[wheel.phase("device")]["device"].packets == 3
+
+
+def test_budget_defers_probes_by_priority(timers: dict[str, list]) -> None:
+    """With one probe in flight allowed, the queued probes start by priority."""
+    hass = _FakeHass()
+    scheduler = ProbeScheduler(hass)
+    scheduler.budget.configure(1, 100)
+
+    # A one second interval has a single slot, so all the probes are due on the same tick
+    scheduler.async_add("low", 1, _probe, PROBE_PRIORITY_BEST_EFFORT)
+    scheduler.async_add("normal", 1, _probe, PROBE_PRIORITY_NORMAL)
+    scheduler.async_add("high", 1, _probe, PROBE_PRIORITY_CRITICAL)
+    (tick, _), = timers["intervals"]
+
+    tick(None)
+    assert hass.started == ["high"]
+
+    hass.finish("high")
+    assert hass.started == ["high", "normal"]
+
+    hass.finish("normal")
+    assert hass.started == ["high", "normal", "low"]
+
+
+def test_budget_defers_probes_by_packets_rate(timers: dict[str, list]) -> None:
+    """Probes over the packets rate are retried once the tokens are back."""
+    hass = _FakeHass()
+    scheduler = ProbeScheduler(hass)
+    scheduler.budget.configure(10, 2)
+
+    scheduler.async_add("first", 1, _probe, PROBE_PRIORITY_CRITICAL, 2)
+    scheduler.async_add("second", 1, _probe, PROBE_PRIORITY_NORMAL, 2)
+    (tick, _), = timers["intervals"]
+
+    tick(None)
+
+    assert hass.started == ["first"]
+    (delay, _), = timers["later"]
+    assert 0 < delay <= 1